@@ -7,30 +7,28 @@ Demonstrates:
   - Measuring roundtrip error for lossy codecs (G.711)
 """
 
+import functools
 import math
 import struct
 
 from aiortp import PayloadType, get_codec
 
 
+@functools.cache
 def generate_sine_pcm(frequency: float, sample_rate: int, num_samples: int) -> bytes:
     """Generate a sine wave as s16le PCM."""
-    buf = bytearray()
-    for i in range(num_samples):
-        sample = int(16000 * math.sin(2 * math.pi * frequency * i / sample_rate))
-        buf += struct.pack("<h", sample)
-    return bytes(buf)
+    step = 2 * math.pi * frequency / sample_rate
+    return struct.pack(
+        f"<{num_samples}h", *(int(16000 * math.sin(step * i)) for i in range(num_samples))
+    )
 
 
 def rms_error(original: bytes, decoded: bytes) -> float:
     """Compute RMS error between two s16le PCM buffers."""
     n = len(original) // 2
-    total = 0.0
-    for i in range(n):
-        a = struct.unpack_from("<h", original, i * 2)[0]
-        b = struct.unpack_from("<h", decoded, i * 2)[0]
-        total += (a - b) ** 2
-    return math.sqrt(total / n)
+    a = struct.unpack(f"<{n}h", original[: n * 2])
+    b = struct.unpack(f"<{n}h", decoded[: n * 2])
+    return math.dist(a, b) / math.sqrt(n)
 
 
 def main() -> None:
@@ -10,20 +10,20 @@ Demonstrates:
 """
 
 import asyncio
+import functools
+import math
 import struct
 
 from aiortp import RTPSession, PayloadType
 
 
+@functools.cache
 def generate_sine_pcm(frequency: float, sample_rate: int, num_samples: int) -> bytes:
     """Generate a sine wave as s16le PCM."""
-    import math
-
-    buf = bytearray()
-    for i in range(num_samples):
-        sample = int(16000 * math.sin(2 * math.pi * frequency * i / sample_rate))
-        buf += struct.pack("<h", sample)
-    return bytes(buf)
+    step = 2 * math.pi * frequency / sample_rate
+    return struct.pack(
+        f"<{num_samples}h", *(int(16000 * math.sin(step * i)) for i in range(num_samples))
+    )
 
 
 async def main() -> None:
@@ -64,12 +64,12 @@ async def main() -> None:
 
     # --- Send 20 frames of 440 Hz tone (20 ms each) from A → B ---
     print("\nSending 20 frames of 440 Hz tone from A → B ...")
+    pcm = generate_sine_pcm(
+        frequency=440.0,
+        sample_rate=8000,
+        num_samples=160,  # 20 ms at 8 kHz
+    )
     for i in range(20):
-        pcm = generate_sine_pcm(
-            frequency=440.0,
-            sample_rate=8000,
-            num_samples=160,  # 20 ms at 8 kHz
-        )
         session_a.send_audio_pcm(pcm, timestamp=i * 160)
 
     # Wait for some frames to arrive
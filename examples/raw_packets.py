@@ -16,6 +16,7 @@ from aiortp import (
     RtpPacket,
     is_rtcp,
 )
+from aiortp.codecs.g711 import ULAW_SILENCE_FRAME
 from aiortp.packet import RtcpSenderInfo, RtcpSourceInfo
 
 
@@ -28,7 +29,7 @@ def main() -> None:
         sequence_number=1000,
         timestamp=8000,
         ssrc=0xDEADBEEF,
-        payload=b"\x80" * 160,  # 160 bytes of µ-law silence
+        payload=ULAW_SILENCE_FRAME,  # 160 bytes of µ-law silence
     )
     data = pkt.serialize()
     print(f"Serialized: {len(data)} bytes")
@@ -77,6 +77,9 @@ async def send_wav(wav_path: str, dest_host: str, dest_port: int) -> None:
 
     print(f"Streaming {total_frames} frames ({frame_duration * 1000:.0f} ms each) ...")
 
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
     for i in range(total_frames):
         offset = i * frame_size
         frame_pcm = pcm_data[offset : offset + frame_size]
@@ -84,8 +87,9 @@ async def send_wav(wav_path: str, dest_host: str, dest_port: int) -> None:
         session.send_audio_pcm(frame_pcm, timestamp=timestamp)
         timestamp += samples_per_frame
 
-        # Real-time pacing: sleep ~20 ms between frames
-        await asyncio.sleep(frame_duration)
+        # Real-time pacing: sleep until this frame's absolute deadline so that
+        # scheduling delays don't accumulate; late frames go out back-to-back.
+        await asyncio.sleep(max(0.0, start + (i + 1) * frame_duration - loop.time()))
 
         # Progress indicator every second
         if (i + 1) % 50 == 0:
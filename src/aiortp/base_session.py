@@ -48,13 +48,33 @@ class BaseRTPSession:
         cname: str = "aiortp",
         rtcp_interval: float = 5.0,
         port_allocator: PortAllocator | None = None,
+        reuse_port: bool = False,
+        reduced_size_rtcp: bool = False,
     ) -> None:
+        if reuse_port and port_allocator is not None:
+            raise ValueError("reuse_port cannot be combined with a port_allocator")
         self._payload_type = payload_type
         self._ssrc = ssrc if ssrc is not None else random32()
         self._clock_rate = clock_rate
         self._cname = cname
         self._rtcp_interval = rtcp_interval
         self._port_allocator = port_allocator
+        # SO_REUSEPORT lets several worker processes bind the same RTP/RTCP ports
+        # and have the kernel spread incoming flows across them.
+        self._reuse_port = reuse_port
+        # RFC 5506: periodic reports go out as a bare SR/RR without SDES.
+        # Only enable when the peer negotiated a=rtcp-rsize.
+        self._reduced_size_rtcp = reduced_size_rtcp
+        # SSRC and CNAME never change, so the SDES chunk is serialized once
+        self._sdes = (
+            b""
+            if reduced_size_rtcp
+            else bytes(
+                RtcpSdesPacket(
+                    chunks=[RtcpSourceInfo(ssrc=self._ssrc, items=[(1, cname.encode("utf-8"))])]
+                )
+            )
+        )
 
         # Transport
         self._rtp_transport: RtpTransport | None = None
@@ -68,7 +88,7 @@ class BaseRTPSession:
         # Stats (initialized lazily by subclasses on first inbound packet)
         self._stream_stats: StreamStatistics | None = None
 
-        # RTCP
+        # RTCP (started by _start_rtcp on first sent or received media)
         self._rtcp_task: asyncio.Task[None] | None = None
 
         # Incoming SR tracking (for LSR/DLSR in receiver reports)
@@ -109,44 +129,59 @@ class BaseRTPSession:
         self._remote_addr = remote_addr
         self._remote_rtcp_addr = self._compute_rtcp_addr(remote_addr)
 
-        # Determine local addresses
-        if self._port_allocator is not None:
-            rtp_port, rtcp_port = await self._port_allocator.allocate()
-            self._allocated_rtp_port = rtp_port
-            rtp_local = (local_addr[0], rtp_port)
-            rtcp_local = (local_addr[0], rtcp_port)
-        else:
-            rtp_local = local_addr
-            rtcp_local = None  # computed after RTP bind
-
         # RTP transport
         rtp_transport_obj = RtpTransport(
             on_rtp=self._handle_rtp,
             on_rtcp=self._handle_rtcp,
         )
-        await self._loop.create_datagram_endpoint(
-            lambda: rtp_transport_obj,
-            local_addr=rtp_local,
+        rtcp_transport_obj = RtpTransport(
+            on_rtp=self._handle_rtp,
+            on_rtcp=self._handle_rtcp,
         )
-        self._rtp_transport = rtp_transport_obj
 
-        # RTCP transport — use allocator port, adjacent port, or OS-assigned
-        if rtcp_local is None:
+        if self._port_allocator is not None:
+            # Use the sockets the allocator already bound, so the pair cannot
+            # be taken by someone else between allocation and use.
+            rtp_port, _ = await self._port_allocator.allocate(local_addr[0], reserve=True)
+            self._allocated_rtp_port = rtp_port
+            rtp_sock, rtcp_sock = self._port_allocator.claim(rtp_port)
+            try:
+                await self._loop.create_datagram_endpoint(lambda: rtp_transport_obj, sock=rtp_sock)
+                self._rtp_transport = rtp_transport_obj
+                await self._loop.create_datagram_endpoint(
+                    lambda: rtcp_transport_obj, sock=rtcp_sock
+                )
+                self._rtcp_transport = rtcp_transport_obj
+            except BaseException:
+                # create() fails before close() is reachable, so undo here
+                rtp_transport_obj.close()
+                self._rtp_transport = None
+                rtp_sock.close()
+                rtcp_sock.close()
+                self._allocated_rtp_port = None
+                await self._port_allocator.release(rtp_port)
+                raise
+        else:
+            await self._loop.create_datagram_endpoint(
+                lambda: rtp_transport_obj,
+                local_addr=local_addr,
+                reuse_port=self._reuse_port,
+            )
+            self._rtp_transport = rtp_transport_obj
+
+            # RTCP transport — adjacent port, or OS-assigned
             rtp_bound = rtp_transport_obj._transport.get_extra_info("sockname")  # type: ignore[union-attr]
             if local_addr[1] == 0:
                 rtcp_local = (local_addr[0], 0)
             else:
                 rtcp_local = (local_addr[0], rtp_bound[1] + 1)
 
-        rtcp_transport_obj = RtpTransport(
-            on_rtp=self._handle_rtp,
-            on_rtcp=self._handle_rtcp,
-        )
-        await self._loop.create_datagram_endpoint(
-            lambda: rtcp_transport_obj,
-            local_addr=rtcp_local,
-        )
-        self._rtcp_transport = rtcp_transport_obj
+            await self._loop.create_datagram_endpoint(
+                lambda: rtcp_transport_obj,
+                local_addr=rtcp_local,
+                reuse_port=self._reuse_port,
+            )
+            self._rtcp_transport = rtcp_transport_obj
 
         # Sender
         self._sender = RtpSender(
@@ -156,9 +191,6 @@ class BaseRTPSession:
             clock_rate=self._clock_rate,
         )
 
-        # Start RTCP loop
-        self._rtcp_task = asyncio.create_task(self._run_rtcp())
-
     def update_remote(self, addr: tuple[str, int]) -> None:
         """Update remote address (e.g., for re-INVITE)."""
         self._remote_addr = addr
@@ -166,6 +198,15 @@ class BaseRTPSession:
 
     # ── RTCP ──────────────────────────────────────────────────
 
+    def _start_rtcp(self) -> None:
+        """Start the periodic RTCP loop.
+
+        Deferred until media flows so sessions that never send or receive
+        do not wake up every interval.
+        """
+        if self._rtcp_task is None and not self._closed and self._loop is not None:
+            self._rtcp_task = self._loop.create_task(self._run_rtcp())
+
     async def _run_rtcp(self) -> None:
         """Periodic RTCP sender loop."""
         try:
@@ -183,15 +224,6 @@ class BaseRTPSession:
         if self._rtcp_transport is None:
             return
 
-        sdes = RtcpSdesPacket(
-            chunks=[
-                RtcpSourceInfo(
-                    ssrc=self._ssrc,
-                    items=[(1, self._cname.encode("utf-8"))],
-                )
-            ]
-        )
-
         # Build receiver report block if we have inbound stats
         rr_block = self._build_receiver_report()
 
@@ -206,13 +238,13 @@ class BaseRTPSession:
                 ),
                 reports=[rr_block] if rr_block else [],
             )
-            self._rtcp_transport.send(bytes(sr) + bytes(sdes), self._remote_rtcp_addr)
+            self._rtcp_transport.send(bytes(sr) + self._sdes, self._remote_rtcp_addr)
         elif rr_block is not None:
             rr = RtcpRrPacket(
                 ssrc=self._ssrc,
                 reports=[rr_block],
             )
-            self._rtcp_transport.send(bytes(rr) + bytes(sdes), self._remote_rtcp_addr)
+            self._rtcp_transport.send(bytes(rr) + self._sdes, self._remote_rtcp_addr)
 
     def _build_receiver_report(self) -> RtcpReceiverInfo | None:
         """Build a receiver report block from stream statistics."""
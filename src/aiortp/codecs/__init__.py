@@ -20,18 +20,35 @@ class PayloadType(IntEnum):
 
 
 _registry: dict[int, type[Codec]] = {}
+_instances: dict[int, Codec] = {}
 
 
 def register_codec(pt: int, cls: type[Codec]) -> None:
-    """Register a codec class for a payload type."""
+    """Register a codec class for a payload type.
+
+    Stateless codecs are instantiated once here and shared by ``get_codec``.
+    """
     _registry[pt] = cls
+    if cls.STATELESS:
+        _instances[pt] = cls()
+    else:
+        _instances.pop(pt, None)
+
 
+def get_codec(pt: int, stateful: bool = False) -> Codec:
+    """Get a codec instance for a payload type.
 
-def get_codec(pt: int) -> Codec:
-    """Get a codec instance for a payload type."""
+    Stateless codecs (G.711, L16) return a shared instance; codecs carrying
+    per-stream state (G.722, Opus) are constructed fresh on every call.  Pass
+    ``stateful=True`` to always get a private instance.
+    """
     cls = _registry.get(pt)
     if cls is None:
         raise ValueError(f"No codec registered for payload type {pt}")
+    if not stateful:
+        codec = _instances.get(pt)
+        if codec is not None:
+            return codec
     return cls()
 
 
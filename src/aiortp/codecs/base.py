@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import ClassVar
 
 
 class Codec(ABC):
+    STATELESS: ClassVar[bool] = False
+    """True if one instance can be shared by any number of streams."""
+
     @property
     @abstractmethod
     def name(self) -> str: ...
@@ -23,3 +28,17 @@ class Codec(ABC):
     def decode(self, payload: bytes) -> bytes:
         """Decode codec payload to 16-bit signed LE PCM."""
         ...
+
+    def encode_batch(self, frames: Sequence[bytes]) -> list[bytes]:
+        """Encode several s16le PCM frames, returning one payload per frame."""
+        return [self.encode(frame) for frame in frames]
+
+
+def split_frames(data: bytes, sizes: Sequence[int]) -> list[bytes]:
+    """Split a concatenated buffer back into consecutive chunks of the given sizes."""
+    result = []
+    offset = 0
+    for size in sizes:
+        result.append(data[offset : offset + size])
+        offset += size
+    return result
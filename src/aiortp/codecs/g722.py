@@ -9,7 +9,8 @@ Note the historical RFC 3551 quirk: the RTP clock rate is 8000 Hz even
 though the actual audio is sampled at 16000 Hz.
 """
 
-import struct
+import array
+import sys
 
 from .base import Codec
 
@@ -57,9 +58,11 @@ class G722Codec(Codec):
         Returns:
             G.722 encoded bytes (160 bytes per frame).
         """
-        num_samples = len(pcm) // 2
-        samples = struct.unpack(f"<{num_samples}h", pcm[: num_samples * 2])
-        return self._encoder.encode(tuple(samples))
+        samples = array.array("h")
+        samples.frombytes(pcm[: len(pcm) & ~1])
+        if sys.byteorder == "big":
+            samples.byteswap()
+        return self._encoder.encode(samples)
 
     def decode(self, payload: bytes) -> bytes:
         """Decode G.722 payload to s16le PCM.
@@ -70,6 +73,7 @@ class G722Codec(Codec):
         Returns:
             Raw PCM-16 LE audio bytes (320 samples = 640 bytes per frame).
         """
-        decoded = self._decoder.decode(payload)
-        num_samples = len(decoded)
-        return struct.pack(f"<{num_samples}h", *decoded)
+        decoded = array.array("h", self._decoder.decode(payload))
+        if sys.byteorder == "big":
+            decoded.byteswap()
+        return decoded.tobytes()
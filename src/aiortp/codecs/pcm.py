@@ -1,11 +1,22 @@
 """L16 (Linear 16-bit PCM) codec — s16le ↔ s16be (network byte order) conversion."""
 
-import struct
+import array
+from collections.abc import Sequence
 
-from .base import Codec
+from .base import Codec, split_frames
+
+
+def _swap16(buf: bytes) -> bytes:
+    """Swap the byte order of every 16-bit sample (trailing odd byte dropped)."""
+    samples = array.array("h")
+    samples.frombytes(buf[: len(buf) & ~1])
+    samples.byteswap()
+    return samples.tobytes()
 
 
 class L16Codec(Codec):
+    STATELESS = True
+
     @property
     def name(self) -> str:
         return "L16"
@@ -20,12 +31,14 @@ class L16Codec(Codec):
 
     def encode(self, pcm: bytes) -> bytes:
         """Convert s16le PCM to s16be (network byte order)."""
-        n_samples = len(pcm) // 2
-        samples = struct.unpack(f"<{n_samples}h", pcm)
-        return struct.pack(f">{n_samples}h", *samples)
+        return _swap16(pcm)
+
+    def encode_batch(self, frames: Sequence[bytes]) -> list[bytes]:
+        """Convert several s16le PCM frames to s16be in a single byteswap."""
+        if any(len(frame) & 1 for frame in frames):
+            return super().encode_batch(frames)
+        return split_frames(_swap16(b"".join(frames)), [len(f) for f in frames])
 
     def decode(self, payload: bytes) -> bytes:
         """Convert s16be (network byte order) to s16le PCM."""
-        n_samples = len(payload) // 2
-        samples = struct.unpack(f">{n_samples}h", payload)
-        return struct.pack(f"<{n_samples}h", *samples)
+        return _swap16(payload)
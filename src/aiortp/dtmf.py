@@ -29,8 +29,11 @@ DTMF_EVENTS: dict[str, int] = {
 
 EVENT_TO_DIGIT: dict[int, str] = {v: k for k, v in DTMF_EVENTS.items()}
 
+# event, E/R/volume flags, duration
+_DTMF_STRUCT = struct.Struct("!BBH")
 
-@dataclass
+
+@dataclass(slots=True)
 class DtmfEvent:
     """RFC 4733 telephone-event payload (4 bytes)."""
 
@@ -41,13 +44,13 @@ class DtmfEvent:
 
     def serialize(self) -> bytes:
         flags = (0x80 if self.end else 0x00) | (self.volume & 0x3F)
-        return struct.pack("!BBH", self.event, flags, self.duration)
+        return _DTMF_STRUCT.pack(self.event, flags, self.duration)
 
     @classmethod
     def parse(cls, data: bytes) -> "DtmfEvent":
-        if len(data) < 4:
+        if len(data) < _DTMF_STRUCT.size:
             raise ValueError("DTMF event payload must be at least 4 bytes")
-        event, flags, duration = struct.unpack("!BBH", data[:4])
+        event, flags, duration = _DTMF_STRUCT.unpack_from(data, 0)
         end = bool(flags & 0x80)
         volume = flags & 0x3F
         return cls(event=event, end=end, volume=volume, duration=duration)
@@ -116,36 +119,17 @@ class DtmfSender:
         # All packets for this event share the same RTP timestamp
         event_timestamp = timestamp
 
-        # Progress packets
-        current_duration = step_samples
-        while current_duration < duration_samples:
-            ev = DtmfEvent(
-                event=event_code,
-                end=False,
-                volume=volume,
-                duration=current_duration,
-            )
-            self._sender.send_raw(
-                self._dtmf_payload_type,
-                ev.serialize(),
-                event_timestamp,
-                marker=0,
-                addr=addr,
-            )
-            current_duration += step_samples
-
-        # End packets (3 redundant, RFC 4733 Section 2.5.1.4)
-        for i in range(3):
-            ev = DtmfEvent(
-                event=event_code,
-                end=True,
-                volume=volume,
-                duration=duration_samples,
-            )
-            self._sender.send_raw(
-                self._dtmf_payload_type,
-                ev.serialize(),
-                event_timestamp,
-                marker=1 if i == 0 else 0,
-                addr=addr,
-            )
+        # Progress packets, then 3 redundant end packets (RFC 4733
+        # Section 2.5.1.4) sharing one payload
+        pack = _DTMF_STRUCT.pack
+        flags = volume & 0x3F
+        packets = [
+            (pack(event_code, flags, duration), 0)
+            for duration in range(step_samples, duration_samples, step_samples)
+        ]
+        end_payload = pack(event_code, 0x80 | flags, duration_samples)
+        packets += ((end_payload, 1), (end_payload, 0), (end_payload, 0))
+
+        send_raw = self._sender.send_raw
+        for payload, marker in packets:
+            send_raw(self._dtmf_payload_type, payload, event_timestamp, marker=marker, addr=addr)
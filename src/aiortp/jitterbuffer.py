@@ -1,5 +1,4 @@
 from .packet import RtpPacket
-from .utils import uint16_add
 
 MAX_MISORDER = 100
 MAX_AUDIO_GAP = 3  # max consecutive lost packets to skip in audio mode
@@ -21,8 +20,15 @@ class JitterBuffer:
     ) -> None:
         assert capacity & (capacity - 1) == 0, "capacity must be a power of 2"
         self._capacity = capacity
+        # capacity divides 65536, so seq & mask stays consistent across wraparound
+        self._mask = capacity - 1
         self._origin: int | None = None
-        self._packets: list[RtpPacket | None] = [None for i in range(capacity)]
+        # Packet fields stored as parallel slot arrays; a slot is empty
+        # when its sequence number is None.
+        self._seqs: list[int | None] = [None] * capacity
+        self._timestamps: list[int] = [0] * capacity
+        self._markers: list[int] = [0] * capacity
+        self._payloads: list[bytes] = [b""] * capacity
         self._prefetch = prefetch
         self._is_video = is_video
         self._skip_audio_gaps = skip_audio_gaps and not is_video
@@ -39,8 +45,8 @@ class JitterBuffer:
             delta = 0
             misorder = 0
         else:
-            delta = uint16_add(packet.sequence_number, -self._origin)
-            misorder = uint16_add(self._origin, -packet.sequence_number)
+            delta = (packet.sequence_number - self._origin) & 0xFFFF
+            misorder = (self._origin - packet.sequence_number) & 0xFFFF
 
         if misorder < delta:
             if misorder >= MAX_MISORDER:
@@ -60,8 +66,11 @@ class JitterBuffer:
             if self._is_video:
                 pli_flag = True
 
-        pos = packet.sequence_number % self._capacity
-        self._packets[pos] = packet
+        pos = packet.sequence_number & self._mask
+        self._seqs[pos] = packet.sequence_number
+        self._timestamps[pos] = packet.timestamp
+        self._markers[pos] = packet.marker
+        self._payloads[pos] = packet.payload
 
         self._video_gap_skipped = False
         frame = self._remove_frame(packet.sequence_number)
@@ -86,32 +95,30 @@ class JitterBuffer:
         frame is skipped and the scan restarts from the next received
         packet.
         """
-        packets: list[RtpPacket] = []
+        payloads: list[bytes] = []
+        first_ts: int | None = None
 
         for count in range(self.capacity):
-            pos = (self._origin + count) % self._capacity  # type: ignore[operator]
-            packet = self._packets[pos]
+            pos = (self._origin + count) & self._mask  # type: ignore[operator]
 
-            if packet is None:
+            if self._seqs[pos] is None:
                 # Check if a packet from a LATER frame exists after the
                 # gap.  If so, the current frame is lost — skip it.
                 # If the later packet has the same timestamp, the missing
                 # packet might still arrive (reordering) — wait.
-                current_ts = packets[0].timestamp if packets else None
-                if self._has_newer_video_frame_after(count, current_ts):
+                if self._has_newer_video_frame_after(count, first_ts):
                     self._video_gap_skipped = True
                     self.remove(count + 1)
                     return self._remove_video_frame()
                 break  # no evidence of loss yet — wait
 
-            packets.append(packet)
+            if first_ts is None:
+                first_ts = self._timestamps[pos]
+            payloads.append(self._payloads[pos])
 
-            if packet.marker:
+            if self._markers[pos]:
                 self.remove(count + 1)
-                return JitterFrame(
-                    data=b"".join([p.payload for p in packets]),
-                    timestamp=packets[0].timestamp,
-                )
+                return JitterFrame(data=b"".join(payloads), timestamp=first_ts)
 
         return None
 
@@ -130,10 +137,9 @@ class JitterBuffer:
             total = gap_offset + g
             if total >= self._capacity:
                 return False
-            pos = (self._origin + total) % self._capacity  # type: ignore[operator]
-            pkt = self._packets[pos]
-            if pkt is not None:
-                if current_ts is None or pkt.timestamp != current_ts:
+            pos = (self._origin + total) & self._mask  # type: ignore[operator]
+            if self._seqs[pos] is not None:
+                if current_ts is None or self._timestamps[pos] != current_ts:
                     return True
         return False
 
@@ -141,41 +147,41 @@ class JitterBuffer:
         """Remove a complete audio frame using timestamp boundaries."""
         frame = None
         frames = 0
-        packets: list[RtpPacket] = []
+        payloads: list[bytes] = []
         remove = 0
         timestamp = None
 
         for count in range(self.capacity):
-            pos = (self._origin + count) % self._capacity  # type: ignore[operator]
-            packet = self._packets[pos]
-            if packet is None:
+            pos = (self._origin + count) & self._mask  # type: ignore[operator]
+            if self._seqs[pos] is None:
                 if self._skip_audio_gaps and self._has_later_packet(count, timestamp):
                     # Audio gap handling: a received packet exists after this
                     # gap, so the missing slot is a lost packet.  Complete the
                     # current in-progress frame and continue scanning.
-                    if packets:
+                    if payloads:
                         if frame is None:
                             frame = JitterFrame(
-                                data=b"".join([x.payload for x in packets]),
-                                timestamp=timestamp,
+                                data=b"".join(payloads),
+                                timestamp=timestamp,  # type: ignore[arg-type]
                             )
                             remove = count
                         frames += 1
                         if frames >= self._prefetch:
                             self.remove(remove)
                             return frame
-                        packets = []
+                        payloads = []
                         timestamp = None
                     continue
                 break
 
+            packet_ts = self._timestamps[pos]
             if timestamp is None:
-                timestamp = packet.timestamp
-            elif packet.timestamp != timestamp:
+                timestamp = packet_ts
+            elif packet_ts != timestamp:
                 # we now have a complete frame, only store the first one
                 if frame is None:
                     frame = JitterFrame(
-                        data=b"".join([x.payload for x in packets]),
+                        data=b"".join(payloads),
                         timestamp=timestamp,
                     )
                     remove = count
@@ -187,10 +193,10 @@ class JitterBuffer:
                     return frame
 
                 # start a new frame
-                packets = []
-                timestamp = packet.timestamp
+                payloads = []
+                timestamp = packet_ts
 
-            packets.append(packet)
+            payloads.append(self._payloads[pos])
 
         return None
 
@@ -205,21 +211,25 @@ class JitterBuffer:
             total = gap_offset + g
             if total >= self._capacity:
                 return False
-            pos = (self._origin + total) % self._capacity  # type: ignore[operator]
-            pkt = self._packets[pos]
-            if pkt is not None:
+            pos = (self._origin + total) & self._mask  # type: ignore[operator]
+            if self._seqs[pos] is not None:
                 # Only skip if the packet after the gap starts a new frame
-                if current_timestamp is not None and pkt.timestamp == current_timestamp:
+                if current_timestamp is not None and self._timestamps[pos] == current_timestamp:
                     return False
                 return True
         return False
 
     def remove(self, count: int) -> None:
         assert count <= self._capacity
-        for _i in range(count):
-            pos = self._origin % self._capacity  # type: ignore[operator]
-            self._packets[pos] = None
-            self._origin = uint16_add(self._origin, 1)  # type: ignore[arg-type]
+        origin: int = self._origin  # type: ignore[assignment]
+        mask = self._mask
+        seqs = self._seqs
+        payloads = self._payloads
+        for i in range(count):
+            pos = (origin + i) & mask
+            seqs[pos] = None
+            payloads[pos] = b""
+        self._origin = (origin + count) & 0xFFFF
 
     def smart_remove(self, count: int) -> bool:
         """
@@ -227,15 +237,24 @@ class JitterBuffer:
         to prevent sending corrupted frames to the decoder.
         """
         timestamp = None
+        origin: int = self._origin  # type: ignore[assignment]
+        mask = self._mask
+        seqs = self._seqs
+        timestamps = self._timestamps
+        payloads = self._payloads
         for i in range(self._capacity):
-            pos = self._origin % self._capacity  # type: ignore[operator]
-            packet = self._packets[pos]
-            if packet is not None:
-                if i >= count and timestamp != packet.timestamp:
+            pos = origin & mask
+            if seqs[pos] is not None:
+                if i >= count and timestamp != timestamps[pos]:
                     break
-                timestamp = packet.timestamp
-            self._packets[pos] = None
-            self._origin = uint16_add(self._origin, 1)  # type: ignore[arg-type]
-            if i == self._capacity - 1:
-                return True
+                timestamp = timestamps[pos]
+            seqs[pos] = None
+            payloads[pos] = b""
+            # Inlined uint16_add(origin, 1), as in remove()
+            origin = (origin + 1) & 0xFFFF
+        else:
+            # Walked the whole buffer: everything was removed
+            self._origin = origin
+            return True
+        self._origin = origin
         return False
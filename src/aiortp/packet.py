@@ -1,6 +1,6 @@
 import os
 from dataclasses import dataclass, field
-from struct import pack, unpack, unpack_from
+from struct import Struct, pack, unpack, unpack_from
 from typing import Any
 
 # used for NACK and retransmission
@@ -13,6 +13,12 @@ DYNAMIC_PAYLOAD_TYPES = range(96, 128)
 RTP_HEADER_LENGTH = 12
 RTCP_HEADER_LENGTH = 4
 
+# Fixed RTP header: V/P/X/CC, M/PT, sequence number, timestamp, SSRC
+RTP_HEADER_STRUCT = Struct("!BBHLL")
+
+# RTCP header, sender SSRC and sender info of a Sender Report
+_RTCP_SR_HEADER = Struct("!BBHLQLLL")
+
 PACKETS_LOST_MIN = -(1 << 23)
 PACKETS_LOST_MAX = (1 << 23) - 1
 
@@ -147,8 +153,12 @@ def pack_rtcp_packet(packet_type: int, count: int, payload: bytes) -> bytes:
     return pack("!BBH", (2 << 6) | count, packet_type, len(payload) // 4) + payload
 
 
+# RFC 5761 demultiplexing: second byte 192-208 marks an RTCP packet type
+_IS_RTCP_TABLE = bytes(1 if 192 <= i <= 208 else 0 for i in range(256))
+
+
 def is_rtcp(msg: bytes) -> bool:
-    return len(msg) >= 2 and msg[1] >= 192 and msg[1] <= 208
+    return len(msg) >= 2 and _IS_RTCP_TABLE[msg[1]] == 1
 
 
 def padl(length: int) -> int:
@@ -159,45 +169,51 @@ def padl(length: int) -> int:
 
 
 def unpack_header_extensions(
-    extension_profile: int, extension_value: bytes
+    extension_profile: int, extension_value: bytes | memoryview
 ) -> list[tuple[int, bytes]]:
     """
     Parse header extensions according to RFC 5285.
+
+    Values are always returned as ``bytes``, even for ``memoryview`` input.
     """
+    if not isinstance(extension_value, bytes):
+        # One copy up front, so every value slice below is bytes
+        extension_value = bytes(extension_value)
     extensions = []
     pos = 0
+    end = len(extension_value)
 
     if extension_profile == 0xBEDE:
         # One-Byte Header
-        while pos < len(extension_value):
+        while pos < end:
+            byte = extension_value[pos]
+            pos += 1
             # skip padding byte
-            if extension_value[pos] == 0:
-                pos += 1
+            if byte == 0:
                 continue
 
-            x_id = (extension_value[pos] & 0xF0) >> 4
-            x_length = (extension_value[pos] & 0x0F) + 1
-            pos += 1
+            x_id = byte >> 4
+            x_length = (byte & 0x0F) + 1
 
-            if len(extension_value) < pos + x_length:
+            if end < pos + x_length:
                 raise ValueError("RTP one-byte header extension value is truncated")
             x_value = extension_value[pos : pos + x_length]
             extensions.append((x_id, x_value))
             pos += x_length
     elif extension_profile == 0x1000:
         # Two-Byte Header
-        while pos < len(extension_value):
+        while pos < end:
             # skip padding byte
             if extension_value[pos] == 0:
                 pos += 1
                 continue
 
-            if len(extension_value) < pos + 2:
+            if end < pos + 2:
                 raise ValueError("RTP two-byte header extension is truncated")
             x_id, x_length = unpack_from("!BB", extension_value, pos)
             pos += 2
 
-            if len(extension_value) < pos + x_length:
+            if end < pos + x_length:
                 raise ValueError("RTP two-byte header extension value is truncated")
             x_value = extension_value[pos : pos + x_length]
             extensions.append((x_id, x_value))
@@ -473,11 +489,22 @@ class RtcpSrPacket:
     reports: list[RtcpReceiverInfo] = field(default_factory=list)
 
     def __bytes__(self) -> bytes:
-        payload = pack("!L", self.ssrc)
-        payload += bytes(self.sender_info)
+        # Header, SSRC and sender info in one pack; length is in 32-bit words minus one
+        info = self.sender_info
+        count = len(self.reports)
+        data = _RTCP_SR_HEADER.pack(
+            (2 << 6) | count,
+            RTCP_SR,
+            6 + 6 * count,
+            self.ssrc,
+            info.ntp_timestamp,
+            info.rtp_timestamp,
+            info.packet_count,
+            info.octet_count,
+        )
         for report in self.reports:
-            payload += bytes(report)
-        return pack_rtcp_packet(RTCP_SR, len(self.reports), payload)
+            data += bytes(report)
+        return data
 
     @classmethod
     def parse(cls, data: bytes, count: int) -> "RtcpSrPacket":
@@ -545,6 +572,19 @@ class RtcpPacket:
 
 
 class RtpPacket:
+    __slots__ = (
+        "version",
+        "marker",
+        "payload_type",
+        "sequence_number",
+        "timestamp",
+        "ssrc",
+        "csrc",
+        "extensions",
+        "payload",
+        "padding_size",
+    )
+
     def __init__(
         self,
         payload_type: int = 0,
@@ -579,7 +619,7 @@ class RtpPacket:
         if len(data) < RTP_HEADER_LENGTH:
             raise ValueError(f"RTP packet length is less than {RTP_HEADER_LENGTH} bytes")
 
-        v_p_x_cc, m_pt, sequence_number, timestamp, ssrc = unpack("!BBHLL", data[0:12])
+        v_p_x_cc, m_pt, sequence_number, timestamp, ssrc = RTP_HEADER_STRUCT.unpack_from(data)
         version = v_p_x_cc >> 6
         padding = (v_p_x_cc >> 5) & 1
         extension = (v_p_x_cc >> 4) & 1
@@ -598,9 +638,9 @@ class RtpPacket:
         )
 
         pos = RTP_HEADER_LENGTH
-        for _i in range(0, cc):
-            packet.csrc.append(unpack_from("!L", data, pos)[0])
-            pos += 4
+        if cc:
+            packet.csrc = list(unpack_from(f"!{cc}L", data, pos))
+            pos += 4 * cc
 
         if extension:
             if len(data) < pos + 4:
@@ -631,8 +671,7 @@ class RtpPacket:
         has_extension = bool(extension_value)
 
         padding = self.padding_size > 0
-        data = pack(
-            "!BBHLL",
+        data = RTP_HEADER_STRUCT.pack(
             (self.version << 6) | (padding << 5) | (has_extension << 4) | len(self.csrc),
             (self.marker << 7) | self.payload_type,
             self.sequence_number,
@@ -2,6 +2,28 @@ import asyncio
 import socket
 
 
+def _bind_pair(host: str, port: int) -> tuple[socket.socket, socket.socket] | None:
+    """Bind UDP sockets on port and port + 1, or return None if either is taken."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    rtp_sock = socket.socket(family, socket.SOCK_DGRAM)
+    rtcp_sock = socket.socket(family, socket.SOCK_DGRAM)
+    try:
+        rtp_sock.bind((host, port))
+        rtcp_sock.bind((host, port + 1))
+    except OSError:
+        rtp_sock.close()
+        rtcp_sock.close()
+        return None
+    return rtp_sock, rtcp_sock
+
+
+def _close_bound_pair(bind: "asyncio.Future[tuple[socket.socket, socket.socket] | None]") -> None:
+    """Close the sockets of a bind whose caller was cancelled."""
+    if not bind.cancelled() and bind.exception() is None:
+        for sock in bind.result() or ():
+            sock.close()
+
+
 class PortAllocator:
     def __init__(self, port_range: tuple[int, int] = (10000, 20000)) -> None:
         self._min_port = port_range[0]
@@ -9,35 +31,75 @@ class PortAllocator:
         # Ensure min_port is even
         if self._min_port % 2 != 0:
             self._min_port += 1
-        self._allocated: set[int] = set()
-        self._lock = asyncio.Lock()
+        # One bit per even RTP port: bit i set <=> min_port + 2*i is allocated
+        self._slots = len(range(self._min_port, self._max_port, 2))
+        self._all_slots = (1 << self._slots) - 1
+        self._bitmap = 0
+        # rtp_port -> reserved (rtp, rtcp) sockets not yet claimed
+        self._reserved: dict[int, tuple[socket.socket, socket.socket]] = {}
+        # Round-robin scan start, so recently released pairs are not reused first
+        self._next_slot = 0
 
-    async def allocate(self) -> tuple[int, int]:
+    async def allocate(self, host: str = "", reserve: bool = False) -> tuple[int, int]:
         """
         Allocate an even/odd port pair for RTP/RTCP.
         Returns (rtp_port, rtcp_port) where rtcp_port = rtp_port + 1.
+
+        By default both ports are only probed, so the caller can bind them
+        itself. With ``reserve=True`` they stay bound until the sockets are
+        taken with :meth:`claim` or freed with :meth:`release`, so no other
+        process can grab them in between.
+        """
+        loop = asyncio.get_running_loop()
+        tried = 0
+        while True:
+            # Picking and marking a slot never awaits, so concurrent callers
+            # cannot pick the same one; the bind itself runs off the loop.
+            free = ~(self._bitmap | tried) & self._all_slots
+            if not free:
+                raise RuntimeError("No available port pair in range")
+            # Lowest free slot at or after the cursor, else wrap around
+            ahead = free >> self._next_slot << self._next_slot
+            pick = ahead or free
+            slot = (pick & -pick).bit_length() - 1
+            self._bitmap |= 1 << slot
+            self._next_slot = slot + 1 if slot + 1 < self._slots else 0
+            port = self._min_port + 2 * slot
+            bind = loop.run_in_executor(None, _bind_pair, host, port)
+            try:
+                sockets = await asyncio.shield(bind)
+            except asyncio.CancelledError:
+                self._bitmap &= ~(1 << slot)
+                bind.add_done_callback(_close_bound_pair)
+                raise
+            if sockets is None:
+                self._bitmap &= ~(1 << slot)
+                tried |= 1 << slot
+                continue
+            if reserve:
+                self._reserved[port] = sockets
+            else:
+                for sock in sockets:
+                    sock.close()
+            return port, port + 1
+
+    def claim(self, rtp_port: int) -> tuple[socket.socket, socket.socket]:
+        """Take ownership of the bound (rtp, rtcp) sockets of a reserved pair.
+
+        The pair stays allocated until :meth:`release`; closing the sockets
+        becomes the caller's responsibility.
         """
-        async with self._lock:
-            for port in range(self._min_port, self._max_port, 2):
-                if port in self._allocated:
-                    continue
-                # Try to bind both ports
-                rtp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                rtcp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                try:
-                    rtp_sock.bind(("", port))
-                    rtcp_sock.bind(("", port + 1))
-                    rtp_sock.close()
-                    rtcp_sock.close()
-                    self._allocated.add(port)
-                    return port, port + 1
-                except OSError:
-                    rtp_sock.close()
-                    rtcp_sock.close()
-                    continue
-            raise RuntimeError("No available port pair in range")
+        sockets = self._reserved.pop(rtp_port, None)
+        if sockets is None:
+            raise ValueError(f"Port {rtp_port} has no reserved sockets")
+        return sockets
 
     async def release(self, rtp_port: int) -> None:
         """Release a previously allocated port pair."""
-        async with self._lock:
-            self._allocated.discard(rtp_port)
+        slot, odd = divmod(rtp_port - self._min_port, 2)
+        if not odd and 0 <= slot < self._slots:
+            self._bitmap &= ~(1 << slot)
+        sockets = self._reserved.pop(rtp_port, None)
+        if sockets is not None:
+            for sock in sockets:
+                sock.close()
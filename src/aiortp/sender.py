@@ -1,8 +1,8 @@
 import logging
 
-from .packet import RTP_HISTORY_SIZE, RtpPacket
+from .packet import RTP_HEADER_STRUCT, RTP_HISTORY_SIZE
 from .transport import RtpTransport
-from .utils import random16, random32, uint16_add, uint32_add
+from .utils import random16, random32, uint16_add
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +68,7 @@ class RtpSender:
 
     def advance_timestamp(self) -> None:
         """Advance the auto-timestamp by one increment."""
-        self._current_timestamp = uint32_add(self._current_timestamp, self._timestamp_increment)
+        self._current_timestamp = (self._current_timestamp + self._timestamp_increment) & 0xFFFFFFFF
 
     def send_raw(
         self,
@@ -83,15 +83,13 @@ class RtpSender:
         Used by DtmfSender and other subsystems that need to send
         with a payload type different from the session default.
         """
-        packet = RtpPacket(
-            payload_type=payload_type,
-            marker=marker,
-            sequence_number=self._sequence_number,
-            timestamp=timestamp,
-            ssrc=self._ssrc,
-            payload=payload,
+        # Plain header: version 2, no padding, extension or CSRCs
+        data = (
+            RTP_HEADER_STRUCT.pack(
+                0x80, (marker << 7) | payload_type, self._sequence_number, timestamp, self._ssrc
+            )
+            + payload
         )
-        data = packet.serialize()
         self._transport.send(data, addr)
 
         # Store in history for NACK retransmission
@@ -99,7 +97,8 @@ class RtpSender:
         self._history[seq] = data
         self._evict_old_history(seq)
 
-        self._sequence_number = uint16_add(self._sequence_number, 1)
+        # Inlined uint16_add(seq, 1): this runs for every packet sent
+        self._sequence_number = (seq + 1) & 0xFFFF
         self._packets_sent += 1
         self._octets_sent += len(payload)
         self._last_rtp_timestamp = timestamp
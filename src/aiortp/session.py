@@ -36,6 +36,8 @@ class RTPSession(BaseRTPSession):
         jitter_prefetch: int = 4,
         skip_audio_gaps: bool = False,
         port_allocator: PortAllocator | None = None,
+        reuse_port: bool = False,
+        reduced_size_rtcp: bool = False,
     ) -> None:
         super().__init__(
             payload_type=payload_type,
@@ -44,6 +46,8 @@ class RTPSession(BaseRTPSession):
             cname=cname,
             rtcp_interval=rtcp_interval,
             port_allocator=port_allocator,
+            reuse_port=reuse_port,
+            reduced_size_rtcp=reduced_size_rtcp,
         )
         self._codec = codec
         self._dtmf_payload_type = dtmf_payload_type
@@ -62,6 +66,9 @@ class RTPSession(BaseRTPSession):
         # DTMF sender (set during create)
         self._dtmf_sender: DtmfSender | None = None
 
+        # DTMF receiver (created on the first telephone-event once on_dtmf is set)
+        self._dtmf_receiver: DtmfReceiver | None = None
+
     @classmethod
     async def create(
         cls,
@@ -78,6 +85,8 @@ class RTPSession(BaseRTPSession):
         jitter_prefetch: int = 4,
         skip_audio_gaps: bool = False,
         port_allocator: PortAllocator | None = None,
+        reuse_port: bool = False,
+        reduced_size_rtcp: bool = False,
     ) -> "RTPSession":
         """Async factory to create and bind an RTP session."""
         if codec is None:
@@ -95,6 +104,8 @@ class RTPSession(BaseRTPSession):
             jitter_prefetch=jitter_prefetch,
             skip_audio_gaps=skip_audio_gaps,
             port_allocator=port_allocator,
+            reuse_port=reuse_port,
+            reduced_size_rtcp=reduced_size_rtcp,
         )
         await session._bind_transports(local_addr, remote_addr)
 
@@ -119,11 +130,15 @@ class RTPSession(BaseRTPSession):
             header = data[:20].hex() if len(data) >= 20 else data.hex()
             logger.warning("Failed to parse RTP packet: len=%d header=%s", len(data), header)
             return
+        self._start_rtcp()
 
         # Check for DTMF
         if packet.payload_type == self._dtmf_payload_type:
-            if self._dtmf_receiver is not None:
-                self._dtmf_receiver.handle_packet(packet)
+            receiver = self._dtmf_receiver
+            if receiver is None and self.on_dtmf is not None:
+                receiver = self._dtmf_receiver = DtmfReceiver(self.on_dtmf)
+            if receiver is not None:
+                receiver.handle_packet(packet)
             return
 
         # Learn remote SSRC from first media packet
@@ -169,19 +184,11 @@ class RTPSession(BaseRTPSession):
             elif isinstance(packet, RtcpByePacket):
                 logger.info("Received RTCP BYE from %s", packet.sources)
 
-    @property
-    def _dtmf_receiver(self) -> DtmfReceiver | None:
-        if not hasattr(self, "_dtmf_receiver_instance"):
-            if self.on_dtmf is not None:
-                self._dtmf_receiver_instance: DtmfReceiver | None = DtmfReceiver(self.on_dtmf)
-            else:
-                self._dtmf_receiver_instance = None
-        return self._dtmf_receiver_instance
-
     def send_audio(self, payload: bytes, timestamp: int) -> None:
         """Send encoded audio payload (already codec-encoded)."""
         if self._sender is None or self._closed:
             return
+        self._start_rtcp()
         self._sender.send_frame(payload, timestamp, addr=self._remote_addr)
 
     def send_audio_auto(self, payload: bytes) -> int:
@@ -191,6 +198,7 @@ class RTPSession(BaseRTPSession):
         """
         if self._sender is None or self._closed:
             return 0
+        self._start_rtcp()
         return self._sender.send_frame_auto(payload, addr=self._remote_addr)
 
     def send_audio_pcm(self, pcm: bytes, timestamp: int) -> None:
@@ -214,6 +222,7 @@ class RTPSession(BaseRTPSession):
         """Send a DTMF digit."""
         if self._dtmf_sender is None or self._closed:
             return
+        self._start_rtcp()
         self._dtmf_sender.send_digit(
             digit, duration_ms, timestamp=timestamp, addr=self._remote_addr
         )
@@ -1,54 +1,93 @@
-import time
+import warnings
+from time import monotonic_ns
 
 from .packet import RTP_HISTORY_SIZE, RtpPacket, clamp_packets_lost
-from .utils import uint16_add, uint16_gt
+
+# Bits 1..RTP_HISTORY_SIZE of the NACK bitmap, i.e. max_seq - 1 back to
+# max_seq - RTP_HISTORY_SIZE; older losses are no longer worth requesting.
+_NACK_WINDOW_MASK = ((1 << RTP_HISTORY_SIZE) - 1) << 1
 
 
 class NackGenerator:
     def __init__(self) -> None:
         self.max_seq: int | None = None
-        self.missing: set[int] = set()
+        # Bit k set <=> sequence number (max_seq - k) & 0xFFFF is missing
+        self._missing_bits = 0
+
+    @property
+    def missing(self) -> frozenset[int]:
+        """
+        Sequence numbers currently considered lost.
+
+        This is a read-only snapshot built from the bitmap on each access;
+        check :attr:`has_missing` first when only emptiness matters.
+        """
+        max_seq = self.max_seq
+        bits = self._missing_bits
+        missing = []
+        while bits:
+            low = bits & -bits
+            missing.append((max_seq - (low.bit_length() - 1)) & 0xFFFF)  # type: ignore[operator]
+            bits ^= low
+        return frozenset(missing)
+
+    @property
+    def has_missing(self) -> bool:
+        """Whether any packet is currently considered lost."""
+        return self._missing_bits != 0
 
     def add(self, packet: RtpPacket) -> bool:
         """
         Mark a new packet as received, and deduce missing packets.
         """
-        missed = False
-
         if self.max_seq is None:
             self.max_seq = packet.sequence_number
-            return missed
-
-        # mark missing packets
-        if uint16_gt(packet.sequence_number, self.max_seq):
-            seq = uint16_add(self.max_seq, 1)
-            while uint16_gt(packet.sequence_number, seq):
-                self.missing.add(seq)
-                missed = True
-                seq = uint16_add(seq, 1)
+            return False
+
+        delta = (packet.sequence_number - self.max_seq) & 0xFFFF
+        if 0 < delta < 0x8000:
+            # Shift the window forward and mark the skipped packets missing
+            bits = self._missing_bits << delta if delta <= RTP_HISTORY_SIZE else 0
+            skipped = min(delta - 1, RTP_HISTORY_SIZE)
+            self._missing_bits = (bits | (((1 << skipped) - 1) << 1)) & _NACK_WINDOW_MASK
             self.max_seq = packet.sequence_number
-        else:
-            self.missing.discard(packet.sequence_number)
-
-        # limit number of tracked packets
-        self.truncate()
+            return delta > 1
 
-        return missed
+        # late or duplicate packet: no longer missing
+        age = -delta & 0xFFFF
+        if age <= RTP_HISTORY_SIZE:
+            self._missing_bits &= ~(1 << age)
+        return False
 
     def truncate(self) -> None:
         """
         Limit the number of missing packets we track.
 
-        Otherwise, the size of RTCP FB messages grows indefinitely.
+        Deprecated: the bitmap never spans more than RTP_HISTORY_SIZE
+        packets, so there is nothing left to truncate. This method will be
+        removed in a future release.
         """
-        if self.max_seq is not None:
-            min_seq = uint16_add(self.max_seq, -RTP_HISTORY_SIZE)
-            for seq in list(self.missing):
-                if uint16_gt(min_seq, seq):
-                    self.missing.discard(seq)
+        warnings.warn(
+            "NackGenerator.truncate() is deprecated and has no effect",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
 
 class StreamStatistics:
+    __slots__ = (
+        "base_seq",
+        "max_seq",
+        "cycles",
+        "packets_received",
+        "_clockrate",
+        "_jitter_q4",
+        "_last_arrival",
+        "_last_timestamp",
+        "_expected_prior",
+        "_received_prior",
+    )
+
     def __init__(self, clockrate: int) -> None:
         self.base_seq: int | None = None
         self.max_seq: int | None = None
@@ -66,28 +105,34 @@ class StreamStatistics:
         self._received_prior = 0
 
     def add(self, packet: RtpPacket) -> None:
-        in_order = self.max_seq is None or uint16_gt(packet.sequence_number, self.max_seq)
+        seq = packet.sequence_number
+        max_seq = self.max_seq
         self.packets_received += 1
 
-        if self.base_seq is None:
-            self.base_seq = packet.sequence_number
-
-        if in_order:
-            arrival = int(time.time() * self._clockrate)
-
-            if self.max_seq is not None and packet.sequence_number < self.max_seq:
-                self.cycles += 1 << 16
-            self.max_seq = packet.sequence_number
-
-            if packet.timestamp != self._last_timestamp and self.packets_received > 1:
-                diff = abs(
-                    (arrival - self._last_arrival)  # type: ignore[operator]
-                    - (packet.timestamp - self._last_timestamp)
-                )
-                self._jitter_q4 += diff - ((self._jitter_q4 + 8) >> 4)
-
-            self._last_arrival = arrival
-            self._last_timestamp = packet.timestamp
+        if max_seq is None:
+            self.base_seq = seq
+        # Inlined uint16_gt(seq, max_seq): this runs for every received packet
+        elif not 0 < ((seq - max_seq) & 0xFFFF) < 0x8000:
+            return
+
+        # Arrival time in clock-rate units; only differences are used
+        arrival = monotonic_ns() * self._clockrate // 1_000_000_000
+
+        if max_seq is not None and seq < max_seq:
+            self.cycles += 1 << 16
+        self.max_seq = seq
+
+        timestamp = packet.timestamp
+        last_timestamp = self._last_timestamp
+        if timestamp != last_timestamp and self.packets_received > 1:
+            diff = abs(
+                (arrival - self._last_arrival)  # type: ignore[operator]
+                - (timestamp - last_timestamp)  # type: ignore[operator]
+            )
+            self._jitter_q4 += diff - ((self._jitter_q4 + 8) >> 4)
+
+        self._last_arrival = arrival
+        self._last_timestamp = timestamp
 
     @property
     def fraction_lost(self) -> int:
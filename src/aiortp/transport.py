@@ -2,7 +2,7 @@ import asyncio
 import logging
 import socket
 from collections.abc import Callable
-from struct import pack, unpack_from
+from struct import Struct
 
 from .packet import is_rtcp
 
@@ -10,6 +10,11 @@ logger = logging.getLogger(__name__)
 
 # STUN magic cookie (RFC 5389)
 _STUN_MAGIC = 0x2112A442
+_STUN_MAGIC_BYTES = _STUN_MAGIC.to_bytes(4, "big")
+
+# STUN message header (type, length, magic cookie) and XOR-MAPPED-ADDRESS attribute
+_STUN_HEADER = Struct("!HHI")
+_STUN_XOR_MAPPED_ADDRESS = Struct("!HHBBHI")
 
 
 def _is_stun(data: bytes) -> bool:
@@ -17,7 +22,7 @@ def _is_stun(data: bytes) -> bool:
     return (
         len(data) >= 20
         and (data[0] & 0xC0) == 0  # first 2 bits must be 0
-        and unpack_from("!I", data, 4)[0] == _STUN_MAGIC
+        and data[4:8] == _STUN_MAGIC_BYTES
     )
 
 
@@ -34,10 +39,10 @@ def _stun_binding_response(request: bytes, addr: tuple[str, int]) -> bytes:
     ip_int = int.from_bytes(socket.inet_aton(addr[0]), "big")
     xport = addr[1] ^ (_STUN_MAGIC >> 16)
     xaddr = ip_int ^ _STUN_MAGIC
-    attr = pack("!HH BBH I", 0x0020, 8, 0, 0x01, xport, xaddr)
+    attr = _STUN_XOR_MAPPED_ADDRESS.pack(0x0020, 8, 0, 0x01, xport, xaddr)
 
     # Header: type 0x0101 (Binding Success), length, magic, txn_id
-    header = pack("!HHI", 0x0101, len(attr), _STUN_MAGIC) + txn_id
+    header = _STUN_HEADER.pack(0x0101, len(attr), _STUN_MAGIC) + txn_id
     return header + attr
 
 
@@ -50,13 +55,24 @@ class RtpTransport(asyncio.DatagramProtocol):
         self._on_rtp = on_rtp
         self._on_rtcp = on_rtcp
         self._transport: asyncio.DatagramTransport | None = None
+        # Bound transport.sendto, looked up once instead of per packet
+        self._sendto: Callable[[bytes, tuple[str, int]], None] | None = None
         self._remote_addr: tuple[str, int] | None = None
         self._closed = asyncio.Event()
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         self._transport = transport  # type: ignore[assignment]
+        self._sendto = self._transport.sendto  # type: ignore[union-attr]
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        # Version 2 RTP/RTCP is by far the common case; STUN always has the
+        # top two bits clear, so only other datagrams need the STUN check.
+        if data and (data[0] & 0xC0) == 0x80:
+            if is_rtcp(data):
+                self._on_rtcp(data)
+            else:
+                self._on_rtp(data)
+            return
         if _is_stun(data):
             # Reply to STUN Binding Requests so ICE connectivity checks pass
             if self._transport is not None and len(data) >= 20 and data[1] == 0x01:
@@ -75,11 +91,12 @@ class RtpTransport(asyncio.DatagramProtocol):
         self._closed.set()
 
     def send(self, data: bytes, addr: tuple[str, int] | None = None) -> None:
-        if self._transport is None:
+        sendto = self._sendto
+        if sendto is None:
             return
         target = addr or self._remote_addr
         if target is not None:
-            self._transport.sendto(data, target)
+            sendto(data, target)
 
     def close(self) -> None:
         if self._transport is not None:
@@ -89,6 +89,8 @@ class VideoRTPSession(BaseRTPSession):
         jitter_capacity: int = _VIDEO_JITTER_CAPACITY,
         codec: str = "h264",
         port_allocator: PortAllocator | None = None,
+        reuse_port: bool = False,
+        reduced_size_rtcp: bool = False,
         fps: int = 30,
     ) -> None:
         factory = _CODEC_FACTORIES.get(codec)
@@ -104,6 +106,8 @@ class VideoRTPSession(BaseRTPSession):
             cname=cname,
             rtcp_interval=rtcp_interval,
             port_allocator=port_allocator,
+            reuse_port=reuse_port,
+            reduced_size_rtcp=reduced_size_rtcp,
         )
         self._codec = codec
         self._fps = fps
@@ -141,6 +145,8 @@ class VideoRTPSession(BaseRTPSession):
         jitter_capacity: int = _VIDEO_JITTER_CAPACITY,
         codec: str = "h264",
         port_allocator: PortAllocator | None = None,
+        reuse_port: bool = False,
+        reduced_size_rtcp: bool = False,
         fps: int = 30,
     ) -> VideoRTPSession:
         """Async factory to create and bind a video RTP session."""
@@ -153,6 +159,8 @@ class VideoRTPSession(BaseRTPSession):
             jitter_capacity=jitter_capacity,
             codec=codec,
             port_allocator=port_allocator,
+            reuse_port=reuse_port,
+            reduced_size_rtcp=reduced_size_rtcp,
             fps=fps,
         )
         await session._bind_transports(local_addr, remote_addr)
@@ -173,6 +181,7 @@ class VideoRTPSession(BaseRTPSession):
         except ValueError:
             logger.warning("Failed to parse video RTP packet (len=%d)", len(data))
             return
+        self._start_rtcp()
 
         if packet.payload_type != self._payload_type:
             if self._rtp_packet_count <= 5:
@@ -320,6 +329,7 @@ class VideoRTPSession(BaseRTPSession):
         """
         if self._sender is None or self._closed:
             return
+        self._start_rtcp()
 
         packetizer = self._handler.packetizer
         all_packets: list[tuple[bytes, bool]] = []
@@ -380,7 +390,11 @@ class VideoRTPSession(BaseRTPSession):
 
     def _send_nack(self) -> None:
         """Send RTCP NACK for missing packets."""
-        if self._rtcp_transport is None or self._remote_ssrc is None or not self._nack_gen.missing:
+        if (
+            self._rtcp_transport is None
+            or self._remote_ssrc is None
+            or not self._nack_gen.has_missing
+        ):
             return
         nack = RtcpRtpfbPacket(
             fmt=RTCP_RTPFB_NACK,
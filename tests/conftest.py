@@ -0,0 +1,47 @@
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from aiortp.session import RTPSession
+
+
+@pytest_asyncio.fixture
+async def session_pair(
+    request: pytest.FixtureRequest,
+) -> AsyncIterator[tuple[RTPSession, RTPSession]]:
+    """Two loopback sessions pointed at each other.
+
+    Session A's RTCP interval can be set through indirect parametrization;
+    it defaults to 60 seconds, which effectively disables RTCP.
+    """
+    session_a = await RTPSession.create(
+        local_addr=("127.0.0.1", 0),
+        remote_addr=("127.0.0.1", 0),  # will update after binding
+        payload_type=0,
+        rtcp_interval=getattr(request, "param", 60.0),
+    )
+    rtp_a_addr = session_a._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
+
+    try:
+        session_b = await RTPSession.create(
+            local_addr=("127.0.0.1", 0),
+            remote_addr=(rtp_a_addr[0], rtp_a_addr[1]),
+            payload_type=0,
+            rtcp_interval=60.0,
+        )
+    except BaseException:
+        await session_a.close()
+        raise
+
+    try:
+        rtp_b_addr = session_b._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
+
+        session_a.update_remote((rtp_b_addr[0], rtp_b_addr[1]))
+
+        yield session_a, session_b
+    finally:
+        try:
+            await session_a.close()
+        finally:
+            await session_b.close()
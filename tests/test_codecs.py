@@ -1,8 +1,16 @@
 import struct
 from unittest import TestCase
 
-from aiortp.codecs import PayloadType, get_codec
-from aiortp.codecs.g711 import PcmaCodec, PcmuCodec
+from aiortp.codecs import PayloadType, _registry, get_codec, register_codec
+from aiortp.codecs.g711 import (
+    _ALAW_DECODE_TABLE,
+    _ALAW_ENCODE_TABLE,
+    _ULAW_DECODE_TABLE,
+    _ULAW_ENCODE_TABLE,
+    ULAW_SILENCE_FRAME,
+    PcmaCodec,
+    PcmuCodec,
+)
 from aiortp.codecs.pcm import L16Codec
 
 
@@ -10,10 +18,8 @@ class PcmuCodecTest(TestCase):
     def test_roundtrip(self) -> None:
         codec = PcmuCodec()
         # Generate a simple PCM signal
-        pcm = b""
-        for i in range(160):
-            sample = int(10000 * (1 if i % 2 == 0 else -1))
-            pcm += struct.pack("<h", sample)
+        samples = [10000 if i % 2 == 0 else -10000 for i in range(160)]
+        pcm = struct.pack("<160h", *samples)
 
         encoded = codec.encode(pcm)
         self.assertEqual(len(encoded), 160)
@@ -22,9 +28,7 @@ class PcmuCodecTest(TestCase):
         self.assertEqual(len(decoded), 320)
 
         # Check roundtrip is close (G.711 is lossy)
-        for i in range(160):
-            original = struct.unpack_from("<h", pcm, i * 2)[0]
-            recovered = struct.unpack_from("<h", decoded, i * 2)[0]
+        for original, recovered in zip(samples, struct.unpack("<160h", decoded), strict=True):
             # µ-law has about 1% error for most values
             self.assertAlmostEqual(original, recovered, delta=abs(original * 0.05) + 16)
 
@@ -33,12 +37,44 @@ class PcmuCodecTest(TestCase):
         # Encode silence (all zeros)
         pcm = b"\x00" * 320  # 160 samples of silence
         encoded = codec.encode(pcm)
+        self.assertEqual(encoded, ULAW_SILENCE_FRAME)
         decoded = codec.decode(encoded)
         # Decoded silence should be close to 0
-        for i in range(160):
-            sample = struct.unpack_from("<h", decoded, i * 2)[0]
+        for sample in struct.unpack("<160h", decoded):
             self.assertAlmostEqual(sample, 0, delta=8)
 
+    def test_silence_frame_matches_tables(self) -> None:
+        codec = PcmuCodec()
+        self.assertEqual(ULAW_SILENCE_FRAME, b"\xff" * 160)
+        self.assertEqual(codec.encode(bytes(320)), ULAW_SILENCE_FRAME)
+        self.assertEqual(codec.encode(bytes(320)), bytes([_ULAW_ENCODE_TABLE[0]]) * 160)
+        self.assertEqual(
+            codec.decode(ULAW_SILENCE_FRAME), struct.pack("<h", _ULAW_DECODE_TABLE[0xFF]) * 160
+        )
+
+    def test_encode_full_range(self) -> None:
+        codec = PcmuCodec()
+        pcm = struct.pack("<65536h", *range(-32768, 32768))
+        encoded = codec.encode(pcm)
+        self.assertEqual(encoded[:32768], bytes(_ULAW_ENCODE_TABLE[32768:]))
+        self.assertEqual(encoded[32768:], bytes(_ULAW_ENCODE_TABLE[:32768]))
+
+    def test_encode_odd_length(self) -> None:
+        codec = PcmuCodec()
+        self.assertEqual(codec.encode(b"\x00" * 321), codec.encode(b"\x00" * 320))
+
+    def test_decode_full_range(self) -> None:
+        codec = PcmuCodec()
+        decoded = codec.decode(bytes(range(256)))
+        self.assertEqual(decoded, struct.pack("<256h", *_ULAW_DECODE_TABLE))
+
+    def test_encode_batch(self) -> None:
+        codec = PcmuCodec()
+        frames = [struct.pack("<160h", *range(i, i + 160)) for i in range(0, 800, 160)]
+        self.assertEqual(codec.encode_batch(frames), [codec.encode(f) for f in frames])
+        self.assertEqual(codec.encode_batch([b"\x00" * 3, b"\x00" * 2]), [b"\xff", b"\xff"])
+        self.assertEqual(codec.encode_batch([]), [])
+
     def test_properties(self) -> None:
         codec = PcmuCodec()
         self.assertEqual(codec.name, "PCMU")
@@ -49,10 +85,8 @@ class PcmuCodecTest(TestCase):
 class PcmaCodecTest(TestCase):
     def test_roundtrip(self) -> None:
         codec = PcmaCodec()
-        pcm = b""
-        for i in range(160):
-            sample = int(10000 * (1 if i % 2 == 0 else -1))
-            pcm += struct.pack("<h", sample)
+        samples = [10000 if i % 2 == 0 else -10000 for i in range(160)]
+        pcm = struct.pack("<160h", *samples)
 
         encoded = codec.encode(pcm)
         self.assertEqual(len(encoded), 160)
@@ -60,9 +94,7 @@ class PcmaCodecTest(TestCase):
         decoded = codec.decode(encoded)
         self.assertEqual(len(decoded), 320)
 
-        for i in range(160):
-            original = struct.unpack_from("<h", pcm, i * 2)[0]
-            recovered = struct.unpack_from("<h", decoded, i * 2)[0]
+        for original, recovered in zip(samples, struct.unpack("<160h", decoded), strict=True):
             self.assertAlmostEqual(original, recovered, delta=abs(original * 0.05) + 16)
 
     def test_silence(self) -> None:
@@ -70,10 +102,30 @@ class PcmaCodecTest(TestCase):
         pcm = b"\x00" * 320
         encoded = codec.encode(pcm)
         decoded = codec.decode(encoded)
-        for i in range(160):
-            sample = struct.unpack_from("<h", decoded, i * 2)[0]
+        for sample in struct.unpack("<160h", decoded):
             self.assertAlmostEqual(sample, 0, delta=16)
 
+    def test_silence_frame_matches_tables(self) -> None:
+        codec = PcmaCodec()
+        encoded = codec.encode(bytes(320))
+        self.assertEqual(encoded, bytes([_ALAW_ENCODE_TABLE[0]]) * 160)
+        self.assertEqual(
+            codec.decode(encoded),
+            struct.pack("<h", _ALAW_DECODE_TABLE[_ALAW_ENCODE_TABLE[0]]) * 160,
+        )
+
+    def test_encode_full_range(self) -> None:
+        codec = PcmaCodec()
+        pcm = struct.pack("<65536h", *range(-32768, 32768))
+        encoded = codec.encode(pcm)
+        self.assertEqual(encoded[:32768], bytes(_ALAW_ENCODE_TABLE[32768:]))
+        self.assertEqual(encoded[32768:], bytes(_ALAW_ENCODE_TABLE[:32768]))
+
+    def test_decode_full_range(self) -> None:
+        codec = PcmaCodec()
+        decoded = codec.decode(bytes(range(256)))
+        self.assertEqual(decoded, struct.pack("<256h", *_ALAW_DECODE_TABLE))
+
     def test_properties(self) -> None:
         codec = PcmaCodec()
         self.assertEqual(codec.name, "PCMA")
@@ -84,9 +136,7 @@ class PcmaCodecTest(TestCase):
 class L16CodecTest(TestCase):
     def test_roundtrip(self) -> None:
         codec = L16Codec()
-        pcm = b""
-        for i in range(160):
-            pcm += struct.pack("<h", i * 100 - 8000)
+        pcm = struct.pack("<160h", *range(-8000, 8000, 100))
 
         encoded = codec.encode(pcm)
         self.assertEqual(len(encoded), 320)
@@ -94,6 +144,15 @@ class L16CodecTest(TestCase):
         decoded = codec.decode(encoded)
         self.assertEqual(decoded, pcm)
 
+    def test_encode_batch(self) -> None:
+        codec = L16Codec()
+        frames = [struct.pack("<160h", *range(i, i + 160)) for i in range(0, 800, 160)]
+        self.assertEqual(codec.encode_batch(frames), [codec.encode(f) for f in frames])
+
+    def test_network_byte_order(self) -> None:
+        codec = L16Codec()
+        self.assertEqual(codec.encode(struct.pack("<2h", 1, -2)), struct.pack(">2h", 1, -2))
+
     def test_properties(self) -> None:
         codec = L16Codec()
         self.assertEqual(codec.name, "L16")
@@ -114,6 +173,25 @@ class RegistryTest(TestCase):
         codec = get_codec(PayloadType.L16)
         self.assertIsInstance(codec, L16Codec)
 
+    def test_get_shared(self) -> None:
+        self.assertIs(get_codec(PayloadType.PCMU), get_codec(PayloadType.PCMU))
+
+    def test_get_stateful(self) -> None:
+        shared = get_codec(PayloadType.PCMU)
+        codec = get_codec(PayloadType.PCMU, stateful=True)
+        self.assertIsInstance(codec, PcmuCodec)
+        self.assertIsNot(codec, shared)
+
+    def test_get_stateful_codec_is_fresh(self) -> None:
+        class StatefulCodec(L16Codec):
+            STATELESS = False
+
+        register_codec(127, StatefulCodec)
+        try:
+            self.assertIsNot(get_codec(127), get_codec(127))
+        finally:
+            del _registry[127]
+
     def test_get_unknown(self) -> None:
         with self.assertRaises(ValueError):
             get_codec(99)
@@ -74,14 +74,14 @@ class DtmfReceiverTest(TestCase):
 
         receiver = DtmfReceiver(on_dtmf)
 
-        # Send 3 redundant end packets (same timestamp)
+        # Send 3 redundant end packets (same timestamp, same payload)
+        payload = DtmfEvent(event=5, end=True, volume=10, duration=1280).serialize()
         for seq in range(3):
-            ev = DtmfEvent(event=5, end=True, volume=10, duration=1280)
             pkt = RtpPacket(
                 payload_type=101,
                 sequence_number=100 + seq,
                 timestamp=2000,
-                payload=ev.serialize(),
+                payload=payload,
             )
             receiver.handle_packet(pkt)
 
@@ -135,9 +135,39 @@ class DtmfSenderTest(TestCase):
         self.assertTrue(len(sent_data) >= 3)  # At least the 3 end packets
         self.assertEqual(sender.packets_sent, len(sent_data))
 
+        # Progress durations step by 20ms (160 samples at 8kHz)
+        durations = [DtmfEvent.parse(RtpPacket.parse(d).payload).duration for d in sent_data]
+        self.assertEqual(durations, [160, 320, 480, 640, 800, 960, 1120, 1280, 1280, 1280])
+
         # Verify last 3 packets are end packets
         for pkt_data in sent_data[-3:]:
             pkt = RtpPacket.parse(pkt_data)
             ev = DtmfEvent.parse(pkt.payload)
             self.assertTrue(ev.end)
             self.assertEqual(ev.event, 1)  # digit "1"
+
+    def test_send_digit_wire_format(self) -> None:
+        """Packets on the wire match RtpPacket serialization."""
+        sent_data: list[bytes] = []
+
+        transport = RtpTransport(on_rtp=lambda d: None, on_rtcp=lambda d: None)
+        transport.send = lambda data, addr=None: sent_data.append(data)  # type: ignore[assignment]
+
+        sender = RtpSender(transport=transport, payload_type=0, ssrc=12345)
+        initial_seq = sender.sequence_number
+        dtmf_sender = DtmfSender(sender=sender, dtmf_payload_type=101)
+
+        dtmf_sender.send_digit("#", duration_ms=60, timestamp=4000)
+
+        self.assertEqual(len(sent_data), 5)
+        for i, pkt_data in enumerate(sent_data):
+            pkt = RtpPacket.parse(pkt_data)
+            expected = RtpPacket(
+                payload_type=101,
+                marker=1 if i == 2 else 0,
+                sequence_number=(initial_seq + i) & 0xFFFF,
+                timestamp=4000,
+                ssrc=12345,
+                payload=pkt.payload,
+            )
+            self.assertEqual(pkt_data, expected.serialize())
@@ -6,16 +6,15 @@ from aiortp.packet import RtpPacket
 
 class JitterBufferTest(TestCase):
     def assertPackets(self, jbuffer: JitterBuffer, expected: list[int | None]) -> None:
-        found = [x.sequence_number if x else None for x in jbuffer._packets]
-        self.assertEqual(found, expected)
+        self.assertEqual(jbuffer._seqs, expected)
 
     def test_create(self) -> None:
         jbuffer = JitterBuffer(capacity=2)
-        self.assertEqual(jbuffer._packets, [None, None])
+        self.assertEqual(jbuffer._seqs, [None, None])
         self.assertEqual(jbuffer._origin, None)
 
         jbuffer = JitterBuffer(capacity=4)
-        self.assertEqual(jbuffer._packets, [None, None, None, None])
+        self.assertEqual(jbuffer._seqs, [None, None, None, None])
         self.assertEqual(jbuffer._origin, None)
 
     def test_add_ordered(self) -> None:
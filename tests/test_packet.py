@@ -9,6 +9,7 @@ from aiortp.packet import (
     RtcpSrPacket,
     RtpPacket,
     clamp_packets_lost,
+    is_rtcp,
     pack_header_extensions,
     pack_packets_lost,
     unpack_header_extensions,
@@ -17,6 +18,54 @@ from aiortp.packet import (
 
 from .utils import TestCase, load
 
+# Truncation tests slice these views without copying the underlying fixture.
+RTCP_RR = memoryview(load("rtcp_rr.bin"))
+RTP_WITH_CSRC = memoryview(load("rtp_with_csrc.bin"))
+RTP_WITH_SDES_MID = memoryview(load("rtp_with_sdes_mid.bin"))
+
+EMPTY_EXTENSIONS = packet.HeaderExtensions()
+
+# Sequence numbers NACKed by the rtcp_rtpfb.bin fixture.
+RTPFB_LOST = [12, 32, 39, 54, 76, 110, 123, 142, 183, 187, 223, 236, 271, 292]
+
+
+def _extensions_map(extensions: list[tuple[int, str]]) -> packet.HeaderExtensionsMap:
+    extensions_map = packet.HeaderExtensionsMap()
+    extensions_map.configure(extensions)
+    return extensions_map
+
+
+# Parsing and serializing only read these maps, so tests can share them.
+EXTENSIONS_MAP_ABS_SEND_TIME = _extensions_map(
+    [(2, "http://www.webrtc.org/experiments/rtp-hdrext/abs-send-time")]
+)
+EXTENSIONS_MAP_MID = _extensions_map([(9, "urn:ietf:params:rtp-hdrext:sdes:mid")])
+EXTENSIONS_MAP_FULL = _extensions_map(
+    [
+        (2, "urn:ietf:params:rtp-hdrext:toffset"),
+        (4, "urn:ietf:params:rtp-hdrext:ssrc-audio-level"),
+        (6, "http://www.webrtc.org/experiments/rtp-hdrext/abs-send-time"),
+        (8, "http://www.ietf.org/id/draft-holmer-rmcat-transport-wide-cc-extensions-01"),
+        (12, "urn:ietf:params:rtp-hdrext:sdes:rtp-stream-id"),
+        (13, "urn:ietf:params:rtp-hdrext:sdes:repaired-rtp-stream-id"),
+    ]
+)
+MAPPED_EXTENSIONS_PACKET = bytes.fromhex(
+    "90640058"  # V/P/X/CC, M/PT, sequence number
+    "65431278"  # Timestamp
+    "12345678"  # SSRC
+    "BEDE0008"  # Extension of size 8x32bit words.
+    "40DA"  # AudioLevel.
+    "220156CE"  # TransmissionOffset.
+    "62123456"  # AbsoluteSendTime.
+    "81CEAB"  # TransportSequenceNumber.
+    "A003"  # VideoRotation.
+    "B2124876"  # PlayoutDelayLimits.
+    "C2727478"  # RtpStreamId
+    "D573747265616D"  # RepairedRtpStreamId
+    "0000"  # Padding to 32bit boundary.
+)
+
 
 class RtcpPacketTest(TestCase):
     def test_bye(self) -> None:
@@ -103,17 +152,19 @@ class RtcpPacketTest(TestCase):
         self.assertEqual(str(cm.exception), "RTCP receiver report length is invalid")
 
     def test_rr_truncated(self) -> None:
-        data = load("rtcp_rr.bin")
+        data = RTCP_RR
 
         for length in range(1, 4):
-            with self.assertRaises(ValueError) as cm:
-                RtcpPacket.parse(data[0:length])
-            self.assertEqual(str(cm.exception), "RTCP packet length is less than 4 bytes")
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError) as cm:
+                    RtcpPacket.parse(data[0:length])
+                self.assertEqual(str(cm.exception), "RTCP packet length is less than 4 bytes")
 
         for length in range(4, 32):
-            with self.assertRaises(ValueError) as cm:
-                RtcpPacket.parse(data[0:length])
-            self.assertEqual(str(cm.exception), "RTCP packet is truncated")
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError) as cm:
+                    RtcpPacket.parse(data[0:length])
+                self.assertEqual(str(cm.exception), "RTCP packet is truncated")
 
     def test_sdes(self) -> None:
         data = load("rtcp_sdes.bin")
@@ -176,10 +227,7 @@ class RtcpPacketTest(TestCase):
         self.assertEqual(pkt.fmt, 1)
         self.assertEqual(pkt.ssrc, 2336520123)
         self.assertEqual(pkt.media_ssrc, 4145934052)
-        self.assertEqual(
-            pkt.lost,
-            [12, 32, 39, 54, 76, 110, 123, 142, 183, 187, 223, 236, 271, 292],
-        )
+        self.assertEqual(pkt.lost, RTPFB_LOST)
         self.assertEqual(bytes(pkt), data)
 
     def test_rtpfb_invalid(self) -> None:
@@ -208,26 +256,24 @@ class RtpPacketTest(TestCase):
     def test_dtmf(self) -> None:
         data = load("rtp_dtmf.bin")
         pkt = RtpPacket.parse(data)
-        self.assertEqual(pkt.version, 2)
-        self.assertEqual(pkt.marker, 1)
-        self.assertEqual(pkt.payload_type, 101)
-        self.assertEqual(pkt.sequence_number, 24152)
-        self.assertEqual(pkt.timestamp, 4021352124)
-        self.assertEqual(pkt.csrc, [])
-        self.assertEqual(pkt.extensions, packet.HeaderExtensions())
+        self.assertEqual(
+            (pkt.version, pkt.marker, pkt.payload_type, pkt.sequence_number, pkt.timestamp),
+            (2, 1, 101, 24152, 4021352124),
+        )
+        self.assertFalse(pkt.csrc)
+        self.assertEqual(pkt.extensions, EMPTY_EXTENSIONS)
         self.assertEqual(len(pkt.payload), 4)
         self.assertEqual(pkt.serialize(), data)
 
     def test_no_ssrc(self) -> None:
         data = load("rtp.bin")
         pkt = RtpPacket.parse(data)
-        self.assertEqual(pkt.version, 2)
-        self.assertEqual(pkt.marker, 0)
-        self.assertEqual(pkt.payload_type, 0)
-        self.assertEqual(pkt.sequence_number, 15743)
-        self.assertEqual(pkt.timestamp, 3937035252)
-        self.assertEqual(pkt.csrc, [])
-        self.assertEqual(pkt.extensions, packet.HeaderExtensions())
+        self.assertEqual(
+            (pkt.version, pkt.marker, pkt.payload_type, pkt.sequence_number, pkt.timestamp),
+            (2, 0, 0, 15743, 3937035252),
+        )
+        self.assertFalse(pkt.csrc)
+        self.assertEqual(pkt.extensions, EMPTY_EXTENSIONS)
         self.assertEqual(len(pkt.payload), 160)
         self.assertEqual(pkt.serialize(), data)
 
@@ -239,13 +285,12 @@ class RtpPacketTest(TestCase):
     def test_padding_only(self) -> None:
         data = load("rtp_only_padding.bin")
         pkt = RtpPacket.parse(data)
-        self.assertEqual(pkt.version, 2)
-        self.assertEqual(pkt.marker, 0)
-        self.assertEqual(pkt.payload_type, 120)
-        self.assertEqual(pkt.sequence_number, 27759)
-        self.assertEqual(pkt.timestamp, 4044047131)
-        self.assertEqual(pkt.csrc, [])
-        self.assertEqual(pkt.extensions, packet.HeaderExtensions())
+        self.assertEqual(
+            (pkt.version, pkt.marker, pkt.payload_type, pkt.sequence_number, pkt.timestamp),
+            (2, 0, 120, 27759, 4044047131),
+        )
+        self.assertFalse(pkt.csrc)
+        self.assertEqual(pkt.extensions, EMPTY_EXTENSIONS)
         self.assertEqual(len(pkt.payload), 0)
         self.assertEqual(pkt.padding_size, 224)
 
@@ -255,24 +300,14 @@ class RtpPacketTest(TestCase):
         self.assertEqual(serialized[-1], data[-1])
 
     def test_padding_only_with_header_extensions(self) -> None:
-        extensions_map = packet.HeaderExtensionsMap()
-        extensions_map.configure(
-            [
-                (
-                    2,
-                    "http://www.webrtc.org/experiments/rtp-hdrext/abs-send-time",
-                ),
-            ]
-        )
-
+        extensions_map = EXTENSIONS_MAP_ABS_SEND_TIME
         data = load("rtp_only_padding_with_header_extensions.bin")
         pkt = RtpPacket.parse(data, extensions_map)
-        self.assertEqual(pkt.version, 2)
-        self.assertEqual(pkt.marker, 0)
-        self.assertEqual(pkt.payload_type, 98)
-        self.assertEqual(pkt.sequence_number, 22138)
-        self.assertEqual(pkt.timestamp, 3171065731)
-        self.assertEqual(pkt.csrc, [])
+        self.assertEqual(
+            (pkt.version, pkt.marker, pkt.payload_type, pkt.sequence_number, pkt.timestamp),
+            (2, 0, 98, 22138, 3171065731),
+        )
+        self.assertFalse(pkt.csrc)
         self.assertEqual(pkt.extensions, packet.HeaderExtensions(abs_send_time=15846540))
         self.assertEqual(len(pkt.payload), 0)
         self.assertEqual(pkt.padding_size, 224)
@@ -297,53 +332,52 @@ class RtpPacketTest(TestCase):
     def test_with_csrc(self) -> None:
         data = load("rtp_with_csrc.bin")
         pkt = RtpPacket.parse(data)
-        self.assertEqual(pkt.version, 2)
-        self.assertEqual(pkt.marker, 0)
-        self.assertEqual(pkt.payload_type, 0)
-        self.assertEqual(pkt.sequence_number, 16082)
-        self.assertEqual(pkt.timestamp, 144)
+        self.assertEqual(
+            (pkt.version, pkt.marker, pkt.payload_type, pkt.sequence_number, pkt.timestamp),
+            (2, 0, 0, 16082, 144),
+        )
         self.assertEqual(pkt.csrc, [2882400001, 3735928559])
-        self.assertEqual(pkt.extensions, packet.HeaderExtensions())
+        self.assertEqual(pkt.extensions, EMPTY_EXTENSIONS)
         self.assertEqual(len(pkt.payload), 160)
         self.assertEqual(pkt.serialize(), data)
 
     def test_with_csrc_truncated(self) -> None:
-        data = load("rtp_with_csrc.bin")
+        data = RTP_WITH_CSRC
         for length in range(12, 20):
-            with self.assertRaises(ValueError) as cm:
-                RtpPacket.parse(data[0:length])
-            self.assertEqual(str(cm.exception), "RTP packet has truncated CSRC")
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError) as cm:
+                    RtpPacket.parse(data[0:length])
+                self.assertEqual(str(cm.exception), "RTP packet has truncated CSRC")
 
     def test_with_sdes_mid(self) -> None:
-        extensions_map = packet.HeaderExtensionsMap()
-        extensions_map.configure([(9, "urn:ietf:params:rtp-hdrext:sdes:mid")])
-
+        extensions_map = EXTENSIONS_MAP_MID
         data = load("rtp_with_sdes_mid.bin")
         pkt = RtpPacket.parse(data, extensions_map)
-        self.assertEqual(pkt.version, 2)
-        self.assertEqual(pkt.marker, 1)
-        self.assertEqual(pkt.payload_type, 111)
-        self.assertEqual(pkt.sequence_number, 14156)
-        self.assertEqual(pkt.timestamp, 1327210925)
-        self.assertEqual(pkt.csrc, [])
+        self.assertEqual(
+            (pkt.version, pkt.marker, pkt.payload_type, pkt.sequence_number, pkt.timestamp),
+            (2, 1, 111, 14156, 1327210925),
+        )
+        self.assertFalse(pkt.csrc)
         self.assertEqual(pkt.extensions, packet.HeaderExtensions(mid="0"))
         self.assertEqual(len(pkt.payload), 54)
         self.assertEqual(pkt.serialize(extensions_map), data)
 
     def test_with_sdes_mid_truncated(self) -> None:
-        data = load("rtp_with_sdes_mid.bin")
+        data = RTP_WITH_SDES_MID
 
         for length in range(12, 16):
-            with self.assertRaises(ValueError) as cm:
-                RtpPacket.parse(data[0:length])
-            self.assertEqual(
-                str(cm.exception), "RTP packet has truncated extension profile / length"
-            )
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError) as cm:
+                    RtpPacket.parse(data[0:length])
+                self.assertEqual(
+                    str(cm.exception), "RTP packet has truncated extension profile / length"
+                )
 
         for length in range(16, 20):
-            with self.assertRaises(ValueError) as cm:
-                RtpPacket.parse(data[0:length])
-            self.assertEqual(str(cm.exception), "RTP packet has truncated extension value")
+            with self.subTest(length=length):
+                with self.assertRaises(ValueError) as cm:
+                    RtpPacket.parse(data[0:length])
+                self.assertEqual(str(cm.exception), "RTP packet has truncated extension value")
 
     def test_truncated(self) -> None:
         data = load("rtp.bin")[0:11]
@@ -366,6 +400,16 @@ class RtpUtilTest(TestCase):
         self.assertEqual(clamp_packets_lost(8388607), 8388607)
         self.assertEqual(clamp_packets_lost(8388608), 8388607)
 
+    def test_is_rtcp(self) -> None:
+        self.assertTrue(is_rtcp(load("rtcp_sr.bin")))
+        self.assertTrue(is_rtcp(load("rtcp_bye.bin")))
+        self.assertFalse(is_rtcp(load("rtp.bin")))
+        self.assertTrue(is_rtcp(b"\x80\xc0"))
+        self.assertTrue(is_rtcp(b"\x80\xd0"))
+        self.assertFalse(is_rtcp(b"\x80\xbf"))
+        self.assertFalse(is_rtcp(b"\x80\xd1"))
+        self.assertFalse(is_rtcp(b"\x80"))
+
     def test_pack_packets_lost(self) -> None:
         self.assertEqual(pack_packets_lost(-8388608), b"\x80\x00\x00")
         self.assertEqual(pack_packets_lost(-1), b"\xff\xff\xff")
@@ -408,6 +452,17 @@ class RtpUtilTest(TestCase):
             [(255, b"0"), (240, b"12")],
         )
 
+    def test_unpack_header_extensions_memoryview(self) -> None:
+        # one-byte, value, padding, value
+        extensions = unpack_header_extensions(0xBEDE, memoryview(b"\x900\x00\x00\x301"))
+        self.assertEqual(extensions, [(9, b"0"), (3, b"1")])
+        self.assertTrue(all(type(value) is bytes for _, value in extensions))
+
+        # two-byte, value (1 byte), padding, value (2 bytes)
+        extensions = unpack_header_extensions(0x1000, memoryview(b"\xff\x010\x00\xf0\x0212"))
+        self.assertEqual(extensions, [(255, b"0"), (240, b"12")])
+        self.assertTrue(all(type(value) is bytes for _, value in extensions))
+
     def test_unpack_header_extensions_bad(self) -> None:
         # one-byte, value (truncated)
         with self.assertRaises(ValueError) as cm:
@@ -441,78 +496,8 @@ class RtpUtilTest(TestCase):
         self.assertEqual(pack_header_extensions([(255, b"0")]), (0x1000, b"\xff\x010\x00"))
 
     def test_map_header_extensions(self) -> None:
-        data = bytearray(
-            [
-                0x90,
-                0x64,
-                0x00,
-                0x58,
-                0x65,
-                0x43,
-                0x12,
-                0x78,
-                0x12,
-                0x34,
-                0x56,
-                0x78,  # SSRC
-                0xBE,
-                0xDE,
-                0x00,
-                0x08,  # Extension of size 8x32bit words.
-                0x40,
-                0xDA,  # AudioLevel.
-                0x22,
-                0x01,
-                0x56,
-                0xCE,  # TransmissionOffset.
-                0x62,
-                0x12,
-                0x34,
-                0x56,  # AbsoluteSendTime.
-                0x81,
-                0xCE,
-                0xAB,  # TransportSequenceNumber.
-                0xA0,
-                0x03,  # VideoRotation.
-                0xB2,
-                0x12,
-                0x48,
-                0x76,  # PlayoutDelayLimits.
-                0xC2,
-                0x72,
-                0x74,
-                0x78,  # RtpStreamId
-                0xD5,
-                0x73,
-                0x74,
-                0x72,
-                0x65,
-                0x61,
-                0x6D,  # RepairedRtpStreamId
-                0x00,
-                0x00,  # Padding to 32bit boundary.
-            ]
-        )
-        extensions_map = packet.HeaderExtensionsMap()
-        extensions_map.configure(
-            [
-                (2, "urn:ietf:params:rtp-hdrext:toffset"),
-                (4, "urn:ietf:params:rtp-hdrext:ssrc-audio-level"),
-                (
-                    6,
-                    "http://www.webrtc.org/experiments/rtp-hdrext/abs-send-time",
-                ),
-                (
-                    8,
-                    "http://www.ietf.org/id/draft-holmer-rmcat-transport-wide-cc-extensions-01",
-                ),
-                (12, "urn:ietf:params:rtp-hdrext:sdes:rtp-stream-id"),
-                (
-                    13,
-                    "urn:ietf:params:rtp-hdrext:sdes:repaired-rtp-stream-id",
-                ),
-            ]
-        )
+        data = MAPPED_EXTENSIONS_PACKET
+        extensions_map = EXTENSIONS_MAP_FULL
 
         pkt = RtpPacket.parse(data, extensions_map)
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import socket
+
 import pytest
 
 from aiortp.port_allocator import PortAllocator
@@ -19,9 +22,90 @@ class TestPortAllocator:
     async def test_release_allows_reuse(self) -> None:
         alloc = PortAllocator(port_range=(30000, 30004))
         rtp1, _ = await alloc.allocate()
+        rtp2, _ = await alloc.allocate()
         await alloc.release(rtp1)
+        rtp3, _ = await alloc.allocate()
+        assert rtp3 == rtp1
+        await alloc.release(rtp2)
+        await alloc.release(rtp3)
+
+    async def test_exhausted_range(self) -> None:
+        alloc = PortAllocator(port_range=(30000, 30004))
+        rtp1, _ = await alloc.allocate()
         rtp2, _ = await alloc.allocate()
-        assert rtp2 == rtp1
+        assert {rtp1, rtp2} == {30000, 30002}
+        with pytest.raises(RuntimeError):
+            await alloc.allocate()
+        await alloc.release(rtp1)
+        await alloc.release(rtp2)
+
+    async def test_concurrent_allocations_are_distinct(self) -> None:
+        alloc = PortAllocator(port_range=(30000, 30100))
+        pairs = await asyncio.gather(*(alloc.allocate() for _ in range(5)))
+        assert len({rtp for rtp, _ in pairs}) == 5
+        for rtp, _ in pairs:
+            await alloc.release(rtp)
+
+    async def test_round_robin(self) -> None:
+        alloc = PortAllocator(port_range=(30000, 30100))
+        rtp1, _ = await alloc.allocate()
+        await alloc.release(rtp1)
+        rtp2, _ = await alloc.allocate()
+        assert rtp2 == rtp1 + 2
+        await alloc.release(rtp2)
+
+    async def test_allocate_leaves_ports_unbound(self) -> None:
+        alloc = PortAllocator(port_range=(30000, 30100))
+        rtp, rtcp = await alloc.allocate()
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            probe.bind(("", rtp))
+        finally:
+            probe.close()
+        with pytest.raises(ValueError):
+            alloc.claim(rtp)
+        await alloc.release(rtp)
+
+    async def test_reserved_ports_held_until_release(self) -> None:
+        alloc = PortAllocator(port_range=(30000, 30100))
+        rtp, rtcp = await alloc.allocate(reserve=True)
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            with pytest.raises(OSError):
+                probe.bind(("", rtp))
+            await alloc.release(rtp)
+            probe.bind(("", rtp))
+        finally:
+            probe.close()
+
+    @pytest.mark.skipif(not socket.has_ipv6, reason="IPv6 unavailable")
+    async def test_ipv6_host(self) -> None:
+        alloc = PortAllocator(port_range=(30000, 30100))
+        rtp, rtcp = await alloc.allocate("::1", reserve=True)
+        rtp_sock, rtcp_sock = alloc.claim(rtp)
+        try:
+            assert rtp_sock.family == socket.AF_INET6
+            assert rtcp_sock.getsockname()[1] == rtcp
+        finally:
+            rtp_sock.close()
+            rtcp_sock.close()
+            await alloc.release(rtp)
+
+    async def test_claim(self) -> None:
+        alloc = PortAllocator(port_range=(30000, 30100))
+        rtp, rtcp = await alloc.allocate(reserve=True)
+        rtp_sock, rtcp_sock = alloc.claim(rtp)
+        try:
+            assert rtp_sock.getsockname()[1] == rtp
+            assert rtcp_sock.getsockname()[1] == rtcp
+            with pytest.raises(ValueError):
+                alloc.claim(rtp)
+            # Claimed sockets belong to the caller; release only frees the pair
+            await alloc.release(rtp)
+            assert rtp_sock.fileno() != -1
+        finally:
+            rtp_sock.close()
+            rtcp_sock.close()
 
     async def test_multiple_allocations_unique(self) -> None:
         alloc = PortAllocator(port_range=(30000, 30100))
@@ -67,3 +151,29 @@ class TestSessionWithAllocator:
         rtp, _ = await alloc.allocate()
         assert 31000 <= rtp < 31100
         await alloc.release(rtp)
+
+    async def test_failed_bind_releases_ports(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        alloc = PortAllocator(port_range=(31000, 31100))
+        loop = asyncio.get_running_loop()
+        create_endpoint = loop.create_datagram_endpoint
+        socks: list[socket.socket] = []
+
+        async def failing_rtcp_endpoint(factory, **kwargs):  # type: ignore[no-untyped-def]
+            socks.append(kwargs["sock"])
+            if len(socks) == 2:
+                raise OSError("endpoint failed")
+            return await create_endpoint(factory, **kwargs)
+
+        monkeypatch.setattr(loop, "create_datagram_endpoint", failing_rtcp_endpoint)
+        with pytest.raises(OSError, match="endpoint failed"):
+            await RTPSession.create(
+                local_addr=("127.0.0.1", 0),
+                remote_addr=("127.0.0.1", 0),
+                payload_type=0,
+                port_allocator=alloc,
+            )
+        monkeypatch.undo()
+
+        # Both claimed sockets are closed and the pair is free again
+        assert all(sock.fileno() == -1 for sock in socks)
+        assert alloc._bitmap == 0
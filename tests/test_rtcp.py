@@ -3,6 +3,7 @@ import asyncio
 import pytest
 
 from aiortp.packet import (
+    RTCP_SR,
     RtcpByePacket,
     RtcpPacket,
     RtcpSdesPacket,
@@ -12,40 +13,23 @@ from aiortp.packet import (
 )
 from aiortp.session import RTPSession
 
+from .utils import watch_rtcp
+
 
 @pytest.mark.asyncio
-async def test_sr_sent() -> None:
+@pytest.mark.parametrize("session_pair", [0.1], indirect=True)  # Very short interval for testing
+async def test_sr_sent(session_pair: tuple[RTPSession, RTPSession]) -> None:
     """Verify SR is sent within the RTCP interval."""
-    session_a = await RTPSession.create(
-        local_addr=("127.0.0.1", 0),
-        remote_addr=("127.0.0.1", 0),
-        payload_type=0,
-        rtcp_interval=0.1,  # Very short interval for testing
-    )
-
-    rtp_a_addr = session_a._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
-
-    session_b = await RTPSession.create(
-        local_addr=("127.0.0.1", 0),
-        remote_addr=(rtp_a_addr[0], rtp_a_addr[1]),
-        payload_type=0,
-        rtcp_interval=60.0,
-    )
+    session_a, _ = session_pair
+    sr_sent = watch_rtcp(session_a, RTCP_SR)
 
-    rtp_b_addr = session_b._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
+    # The RTCP loop starts with media, and SR needs at least one packet sent
+    session_a.send_audio(b"\x00" * 160, timestamp=0)
 
-    # Point A to B
-    session_a.update_remote((rtp_b_addr[0], rtp_b_addr[1]))
-
-    # Wait for at least one RTCP report
-    await asyncio.sleep(0.5)
-
-    # Check stats show packets sent
-    stats = session_a.stats
-    assert stats["ssrc"] == session_a._ssrc
-
-    await session_a.close()
-    await session_b.close()
+    data = await asyncio.wait_for(sr_sent, timeout=1.0)
+    packets = RtcpPacket.parse(data)
+    assert isinstance(packets[0], RtcpSrPacket)
+    assert packets[0].ssrc == session_a._ssrc
 
 
 @pytest.mark.asyncio
@@ -1,48 +1,33 @@
 import asyncio
+import socket
 
 import pytest
 
 from aiortp.packet import (
+    RTCP_BYE,
     RTCP_RTPFB_NACK,
+    RtcpByePacket,
     RtcpPacket,
     RtcpReceiverInfo,
     RtcpRrPacket,
     RtcpRtpfbPacket,
     RtcpSrPacket,
 )
+from aiortp.port_allocator import PortAllocator
 from aiortp.sender import RtpSender
 from aiortp.session import RTPSession
 from aiortp.transport import RtpTransport
 
+from .utils import watch_rtcp
+
 
 @pytest.mark.asyncio
-async def test_loopback_raw() -> None:
+async def test_loopback_raw(session_pair: tuple[RTPSession, RTPSession]) -> None:
     """Two sessions exchange raw payloads on localhost."""
+    session_a, session_b = session_pair
     received: list[tuple[bytes, int]] = []
     event = asyncio.Event()
 
-    session_a = await RTPSession.create(
-        local_addr=("127.0.0.1", 0),
-        remote_addr=("127.0.0.1", 0),  # will update after binding
-        payload_type=0,
-        rtcp_interval=60.0,  # effectively disable RTCP for this test
-    )
-
-    # Get the actual bound port for session A
-    rtp_a_addr = session_a._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
-
-    session_b = await RTPSession.create(
-        local_addr=("127.0.0.1", 0),
-        remote_addr=(rtp_a_addr[0], rtp_a_addr[1]),
-        payload_type=0,
-        rtcp_interval=60.0,
-    )
-
-    rtp_b_addr = session_b._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
-
-    # Update session A to point to session B
-    session_a.update_remote((rtp_b_addr[0], rtp_b_addr[1]))
-
     def on_audio(data: bytes, timestamp: int) -> None:
         received.append((data, timestamp))
         if len(received) >= 1:
@@ -65,9 +50,6 @@ async def test_loopback_raw() -> None:
     # The first received frame should be from the first packet
     assert received[0][1] == 0  # timestamp of first frame
 
-    await session_a.close()
-    await session_b.close()
-
 
 @pytest.mark.asyncio
 async def test_stats() -> None:
@@ -91,34 +73,50 @@ async def test_stats() -> None:
 
 
 @pytest.mark.asyncio
-async def test_rtcp_bye_on_close() -> None:
-    """Verify BYE is sent on close."""
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT unavailable")
+async def test_reuse_port() -> None:
+    """Two sessions with reuse_port can bind the same RTP port."""
     session_a = await RTPSession.create(
         local_addr=("127.0.0.1", 0),
-        remote_addr=("127.0.0.1", 0),
+        remote_addr=("127.0.0.1", 19999),
         payload_type=0,
         rtcp_interval=60.0,
+        reuse_port=True,
     )
-
-    rtp_a_addr = session_a._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
+    port = session_a._rtp_transport._transport.get_extra_info("sockname")[1]  # type: ignore[union-attr]
 
     session_b = await RTPSession.create(
-        local_addr=("127.0.0.1", 0),
-        remote_addr=(rtp_a_addr[0], rtp_a_addr[1]),
+        local_addr=("127.0.0.1", port),
+        remote_addr=("127.0.0.1", 19999),
         payload_type=0,
         rtcp_interval=60.0,
+        reuse_port=True,
     )
+    bound = session_b._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
+    assert bound[1] == port
 
-    rtp_b_addr = session_b._rtp_transport._transport.get_extra_info("sockname")  # type: ignore[union-attr]
+    await session_a.close()
+    await session_b.close()
+
+
+def test_reuse_port_with_allocator_rejected() -> None:
+    with pytest.raises(ValueError):
+        RTPSession(payload_type=0, port_allocator=PortAllocator(), reuse_port=True)
 
-    session_a.update_remote((rtp_b_addr[0], rtp_b_addr[1]))
+
+@pytest.mark.asyncio
+async def test_rtcp_bye_on_close(session_pair: tuple[RTPSession, RTPSession]) -> None:
+    """Verify BYE is sent on close."""
+    session_a, _ = session_pair
+    bye_sent = watch_rtcp(session_a, RTCP_BYE)
 
     # Close session A - should send BYE
     await session_a.close()
-    # Give time for BYE to arrive
-    await asyncio.sleep(0.1)
 
-    await session_b.close()
+    data = await asyncio.wait_for(bye_sent, timeout=0.5)
+    packets = RtcpPacket.parse(data)
+    assert isinstance(packets[0], RtcpByePacket)
+    assert packets[0].sources == [session_a._ssrc]
 
 
 @pytest.mark.asyncio
@@ -168,6 +166,52 @@ async def test_sr_contains_real_rtp_timestamp() -> None:
     await session.close()
 
 
+@pytest.mark.asyncio
+async def test_rtcp_loop_starts_with_media() -> None:
+    """The RTCP loop is only scheduled once media is sent."""
+    session = await RTPSession.create(
+        local_addr=("127.0.0.1", 0),
+        remote_addr=("127.0.0.1", 19999),
+        payload_type=0,
+        rtcp_interval=60.0,
+    )
+    assert session._rtcp_task is None
+
+    session.send_audio(b"\x00" * 160, timestamp=0)
+    task = session._rtcp_task
+    assert task is not None
+
+    session.send_audio(b"\x00" * 160, timestamp=160)
+    assert session._rtcp_task is task
+
+    await session.close()
+    assert task.done()
+
+
+@pytest.mark.asyncio
+async def test_reduced_size_rtcp() -> None:
+    """With reduced-size RTCP the SR is sent without SDES."""
+    sent_rtcp: list[bytes] = []
+
+    session = await RTPSession.create(
+        local_addr=("127.0.0.1", 0),
+        remote_addr=("127.0.0.1", 19999),
+        payload_type=0,
+        rtcp_interval=60.0,
+        reduced_size_rtcp=True,
+    )
+    session._rtcp_transport.send = lambda data, addr=None: sent_rtcp.append(data)  # type: ignore[union-attr, assignment]
+
+    session.send_audio(b"\x00" * 160, timestamp=0)
+    session._send_rtcp_report()
+
+    assert len(sent_rtcp) == 1
+    packets = RtcpPacket.parse(sent_rtcp[0])
+    assert [type(p) for p in packets] == [RtcpSrPacket]
+
+    await session.close()
+
+
 @pytest.mark.asyncio
 async def test_rr_sent_when_receiving() -> None:
     """Receiver report is included in SR when we have inbound stats."""
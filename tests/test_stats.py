@@ -1,30 +1,54 @@
 from unittest import TestCase
 
-from aiortp.packet import RtpPacket
+from aiortp.packet import RTP_HISTORY_SIZE, RtpPacket
 from aiortp.stats import NackGenerator, StreamStatistics
 
+# 20 ms of 8 kHz audio per packet; the code under test never mutates them.
+PACKETS = [RtpPacket(sequence_number=i, timestamp=i * 160) for i in range(4)]
+
 
 class NackGeneratorTest(TestCase):
     def test_sequential(self) -> None:
         nack = NackGenerator()
-        self.assertFalse(nack.add(RtpPacket(sequence_number=0)))
-        self.assertFalse(nack.add(RtpPacket(sequence_number=1)))
-        self.assertFalse(nack.add(RtpPacket(sequence_number=2)))
+        self.assertFalse(nack.add(PACKETS[0]))
+        self.assertFalse(nack.add(PACKETS[1]))
+        self.assertFalse(nack.add(PACKETS[2]))
         self.assertEqual(nack.missing, set())
 
     def test_gap(self) -> None:
         nack = NackGenerator()
-        self.assertFalse(nack.add(RtpPacket(sequence_number=0)))
-        self.assertTrue(nack.add(RtpPacket(sequence_number=2)))
+        self.assertFalse(nack.add(PACKETS[0]))
+        self.assertTrue(nack.add(PACKETS[2]))
         self.assertEqual(nack.missing, {1})
 
     def test_gap_then_fill(self) -> None:
         nack = NackGenerator()
-        self.assertFalse(nack.add(RtpPacket(sequence_number=0)))
-        self.assertTrue(nack.add(RtpPacket(sequence_number=3)))
+        self.assertFalse(nack.add(PACKETS[0]))
+        self.assertTrue(nack.add(PACKETS[3]))
         self.assertEqual(nack.missing, {1, 2})
-        self.assertFalse(nack.add(RtpPacket(sequence_number=1)))
+        self.assertFalse(nack.add(PACKETS[1]))
         self.assertEqual(nack.missing, {2})
+        self.assertTrue(nack.has_missing)
+        self.assertFalse(nack.add(PACKETS[2]))
+        self.assertFalse(nack.has_missing)
+
+    def test_gap_across_wrap(self) -> None:
+        nack = NackGenerator()
+        self.assertFalse(nack.add(RtpPacket(sequence_number=65534)))
+        self.assertTrue(nack.add(PACKETS[1]))
+        self.assertEqual(nack.missing, {65535, 0})
+
+    def test_truncate_to_history(self) -> None:
+        nack = NackGenerator()
+        self.assertFalse(nack.add(PACKETS[0]))
+        self.assertTrue(nack.add(PACKETS[2]))
+        self.assertTrue(nack.add(RtpPacket(sequence_number=1000)))
+        self.assertEqual(nack.missing, set(range(1000 - RTP_HISTORY_SIZE, 1000)))
+
+    def test_truncate_deprecated(self) -> None:
+        nack = NackGenerator()
+        with self.assertWarns(DeprecationWarning):
+            nack.truncate()
 
     def test_first_packet(self) -> None:
         nack = NackGenerator()
@@ -36,9 +60,9 @@ class NackGeneratorTest(TestCase):
 class StreamStatisticsTest(TestCase):
     def test_sequential(self) -> None:
         stats = StreamStatistics(clockrate=8000)
-        stats.add(RtpPacket(sequence_number=0, timestamp=0))
-        stats.add(RtpPacket(sequence_number=1, timestamp=160))
-        stats.add(RtpPacket(sequence_number=2, timestamp=320))
+        stats.add(PACKETS[0])
+        stats.add(PACKETS[1])
+        stats.add(PACKETS[2])
 
         self.assertEqual(stats.packets_received, 3)
         self.assertEqual(stats.packets_expected, 3)
@@ -48,10 +72,10 @@ class StreamStatisticsTest(TestCase):
 
     def test_with_loss(self) -> None:
         stats = StreamStatistics(clockrate=8000)
-        stats.add(RtpPacket(sequence_number=0, timestamp=0))
-        stats.add(RtpPacket(sequence_number=1, timestamp=160))
+        stats.add(PACKETS[0])
+        stats.add(PACKETS[1])
         # skip seq 2
-        stats.add(RtpPacket(sequence_number=3, timestamp=480))
+        stats.add(PACKETS[3])
 
         self.assertEqual(stats.packets_received, 3)
         self.assertEqual(stats.packets_expected, 4)
@@ -59,15 +83,15 @@ class StreamStatisticsTest(TestCase):
 
     def test_fraction_lost(self) -> None:
         stats = StreamStatistics(clockrate=8000)
-        stats.add(RtpPacket(sequence_number=0, timestamp=0))
-        stats.add(RtpPacket(sequence_number=1, timestamp=160))
+        stats.add(PACKETS[0])
+        stats.add(PACKETS[1])
 
         # First call resets interval counters
         frac = stats.fraction_lost
         self.assertEqual(frac, 0)
 
         # Now skip a packet
-        stats.add(RtpPacket(sequence_number=3, timestamp=480))
+        stats.add(PACKETS[3])
         frac = stats.fraction_lost
         # 2 expected in interval (seq 2 and 3), 1 received -> 1 lost
         # fraction = (1 << 8) // 2 = 128
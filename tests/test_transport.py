@@ -0,0 +1,65 @@
+import socket
+import struct
+from unittest import TestCase
+
+from aiortp.transport import RtpTransport, _is_stun, _stun_binding_response
+
+from .utils import load
+
+# STUN Binding Request: type, length, magic cookie, 12-byte transaction ID
+BINDING_REQUEST = struct.pack("!HHI", 0x0001, 0, 0x2112A442) + bytes(range(12))
+
+
+class StunTest(TestCase):
+    def test_is_stun(self) -> None:
+        self.assertTrue(_is_stun(BINDING_REQUEST))
+        self.assertFalse(_is_stun(load("rtp.bin")))
+        self.assertFalse(_is_stun(load("rtcp_sr.bin")))
+        self.assertFalse(_is_stun(BINDING_REQUEST[:19]))
+
+    def test_binding_response(self) -> None:
+        resp = _stun_binding_response(BINDING_REQUEST, ("192.0.2.1", 5004))
+        self.assertEqual(len(resp), 32)
+        self.assertEqual(struct.unpack_from("!HHI", resp, 0), (0x0101, 12, 0x2112A442))
+        self.assertEqual(resp[8:20], BINDING_REQUEST[8:20])
+
+        attr_type, attr_len, _, family, xport, xaddr = struct.unpack_from("!HHBBHI", resp, 20)
+        self.assertEqual((attr_type, attr_len, family), (0x0020, 8, 0x01))
+        self.assertEqual(xport ^ 0x2112, 5004)
+        self.assertEqual(socket.inet_ntoa(struct.pack("!I", xaddr ^ 0x2112A442)), "192.0.2.1")
+
+
+class FakeDatagramTransport:
+    def __init__(self) -> None:
+        self.sent: list[tuple[bytes, tuple[str, int]]] = []
+
+    def sendto(self, data: bytes, addr: tuple[str, int]) -> None:
+        self.sent.append((data, addr))
+
+
+class DatagramReceivedTest(TestCase):
+    def setUp(self) -> None:
+        self.rtp: list[bytes] = []
+        self.rtcp: list[bytes] = []
+        self.transport = RtpTransport(on_rtp=self.rtp.append, on_rtcp=self.rtcp.append)
+        self.fake = FakeDatagramTransport()
+        self.transport.connection_made(self.fake)  # type: ignore[arg-type]
+
+    def test_rtp(self) -> None:
+        data = load("rtp.bin")
+        self.transport.datagram_received(data, ("127.0.0.1", 5004))
+        self.assertEqual(self.rtp, [data])
+        self.assertEqual(self.rtcp, [])
+
+    def test_rtcp(self) -> None:
+        data = load("rtcp_sr.bin")
+        self.transport.datagram_received(data, ("127.0.0.1", 5005))
+        self.assertEqual(self.rtp, [])
+        self.assertEqual(self.rtcp, [data])
+
+    def test_stun_binding_request(self) -> None:
+        addr = ("127.0.0.1", 5004)
+        self.transport.datagram_received(BINDING_REQUEST, addr)
+        self.assertEqual(self.rtp, [])
+        self.assertEqual(self.rtcp, [])
+        self.assertEqual(self.fake.sent, [(_stun_binding_response(BINDING_REQUEST, addr), addr)])
@@ -1,7 +1,11 @@
+import asyncio
 import os
 import unittest
+from functools import cache
 from typing import TypeVar, cast
 
+from aiortp.base_session import BaseRTPSession
+
 T = TypeVar("T")
 
 
@@ -11,7 +15,24 @@ class TestCase(unittest.TestCase):
         return cast(T, obj)
 
 
+@cache
 def load(name: str) -> bytes:
     path = os.path.join(os.path.dirname(__file__), name)
     with open(path, "rb") as fp:
         return fp.read()
+
+
+def watch_rtcp(session: BaseRTPSession, packet_type: int) -> asyncio.Future[bytes]:
+    """Return a future resolved with the first RTCP datagram of the given type sent."""
+    future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+    transport = session._rtcp_transport
+    assert transport is not None
+    send = transport.send
+
+    def watched_send(data: bytes, addr: tuple[str, int] | None = None) -> None:
+        send(data, addr)
+        if data[1] == packet_type and not future.done():
+            future.set_result(data)
+
+    transport.send = watched_send  # type: ignore[method-assign]
+    return future